@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.authentication"
+
+    def ready(self):
+        from rest_framework_simplejwt import state
+
+        from apps.authentication.token_backend import build_token_backend
+
+        # Tokens resolve ``state.token_backend`` lazily, so this covers every token class
+        state.token_backend = build_token_backend()
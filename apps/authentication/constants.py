@@ -0,0 +1,4 @@
+SEND_EMAIL_TASK = "bootstrap_send_email"
+
+PASSWORD_RESET_TEMPLATE = "email_forget_password.html"
+PASSWORD_RESET_SUBJECT = "🔒 Forgot your password? Reset now"
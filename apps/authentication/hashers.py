@@ -0,0 +1,82 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from gevent import monkey
+from gevent.threadpool import ThreadPool
+
+from utils.metrics import (
+    PASSWORD_HASHING_IN_FLIGHT,
+    PASSWORD_HASHING_POOL_SIZE,
+    record_password_hashing,
+)
+
+
+class PasswordHashingPool:
+    """
+    Bounded pool of native threads used to run password hashing off the event loop.
+
+    ``hashlib.pbkdf2_hmac`` releases the GIL, so native threads hash in parallel
+    while the gevent hub keeps serving other greenlets.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.force = False
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        PASSWORD_HASHING_POOL_SIZE.set(size)
+
+    @property
+    def enabled(self):
+        return bool(self.size) and (self.force or monkey.is_module_patched("threading"))
+
+    def run(self, func, *args):
+        if not self.enabled:
+            return func(*args)
+
+        submitted_at = time.perf_counter()
+        timings = {}
+
+        def job():
+            # Runs on a native thread, metrics are recorded back on the greenlet
+            timings["started_at"] = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                timings["finished_at"] = time.perf_counter()
+
+        PASSWORD_HASHING_IN_FLIGHT.inc()
+        try:
+            return self._get_pool().spawn(job).get()
+        finally:
+            PASSWORD_HASHING_IN_FLIGHT.dec()
+            if "started_at" in timings:
+                record_password_hashing(
+                    timings["started_at"] - submitted_at,
+                    timings["finished_at"] - timings["started_at"],
+                )
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPool(self.size)
+        return self._pool
+
+
+password_hashing_pool = PasswordHashingPool(settings.PASSWORD_HASHING_POOL_SIZE)
+
+
+class PooledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 hasher that computes digests in the password hashing pool.
+
+    The algorithm name is unchanged so existing hashes keep verifying, and
+    ``verify`` goes through ``encode`` so both hashing and checking are offloaded
+    as long as no other ``pbkdf2_sha256`` hasher is configured.
+    """
+
+    def encode(self, password, salt, iterations=None):
+        return password_hashing_pool.run(super().encode, password, salt, iterations)
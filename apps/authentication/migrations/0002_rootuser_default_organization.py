@@ -0,0 +1,41 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_default_organization(apps, schema_editor):
+    RootUser = apps.get_model("authentication", "RootUser")
+    OrganizationRoleUser = apps.get_model("organization_roles", "OrganizationRoleUser")
+    RootUser.objects.update(
+        default_organization_id=Subquery(
+            OrganizationRoleUser.objects.filter(root_user_id=OuterRef("pk"))
+            .order_by("created_at", "id")
+            .values("organization_role__organization_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authentication", "0001_initial"),
+        ("organization", "0003_processedtask"),
+        ("organization_roles", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rootuser",
+            name="default_organization",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Organization of the user's oldest membership, used at login",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="organization.organization",
+            ),
+        ),
+        migrations.RunPython(populate_default_organization, migrations.RunPython.noop),
+    ]
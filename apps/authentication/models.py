@@ -57,6 +57,14 @@ class RootUser(AbstractUser):
         models.CharField(max_length=256, choices=SocialProvider.choices, null=True),
         default=[SocialProvider.NONE_PROVIDER],
     )
+    default_organization = models.ForeignKey(
+        "organization.Organization",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="Organization of the user's oldest membership, used at login",
+    )
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
@@ -6,8 +6,10 @@ from common.apps.refresh_tokens.serializers import (
 from rest_framework import serializers
 
 from apps.authentication.models import RootUser
-from apps.authentication.services import create_organization_jwt_tokens
-from apps.organization.models import Organization
+from apps.authentication.services import (
+    create_organization_jwt_tokens,
+    get_default_organization_slug,
+)
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -20,12 +22,7 @@ class UserSerializer(serializers.ModelSerializer):
 
 class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
     def get_tokens(self):
-        default_organization = Organization.objects.filter(
-            organizationpolicy__organizationrole__organization_role_user__root_user=self.user,
-        ).first()
-        default_organization_slug = (
-            default_organization.slug_name if default_organization else None
-        )
+        default_organization_slug = get_default_organization_slug(self.user)
         refresh_token, access_token = create_organization_jwt_tokens(
             self.user, organization_slug=default_organization_slug
         )
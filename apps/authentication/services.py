@@ -1,27 +1,39 @@
+import logging
 from typing import Literal
 
+import jwt
 import requests
 from common.apps.refresh_tokens.services import create_jwt_tokens
 from django.conf import settings
-from django.core.cache import cache
 from django.template.loader import render_to_string
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from apps.authentication.constants import SEND_EMAIL_TASK
 from apps.authentication.models import RootUser
-from apps.organization.models import Organization
+from apps.organization_roles.claims import COMPACT_CLAIM, encode_organization_roles
 from apps.organization_roles.models import OrganizationRoleUser
+from apps.organization_roles.services import (
+    organization_role_claims_cache,
+    organization_roles_cache,
+)
+from utils.jwks import JWKSCache, JWKSError
+from utils.task_producer import task_producer
 
+logger = logging.getLogger(__name__)
 
-def create_organization_access_token(user_id, access_token):
-    organization_roles_cache = cache.get(f"organization_roles_{user_id}")
-    if organization_roles_cache:
-        access_token["organization_roles"] = organization_roles_cache
-        return access_token
+# Context shared by every email template, computed once per process
+EMAIL_TEMPLATE_DEFAULTS = {"host": settings.HOST}
+
+# Pooled session shared by all outbound OAuth provider calls
+oauth_session = requests.Session()
+_jwks_caches = {}
 
+
+def get_organization_role_users(user_id):
     # query role per organization
-    org_role_users = (
+    return (
         OrganizationRoleUser.objects.filter(
             root_user_id=user_id, organization_role__organization__is_active=True
         )
@@ -30,16 +42,45 @@ def create_organization_access_token(user_id, access_token):
         .distinct("organization_role__organization_id")
     )
 
+
+def get_organization_roles(user_id):
+    org_role_users = list(get_organization_role_users(user_id))
+
     # build dict organization_slug -> role_name
     organization_roles_dict = {}
     for org_role_user in org_role_users:
         org_slug = str(org_role_user.organization_role.organization.slug_name)
         role_name = str(org_role_user.organization_role.name)
         organization_roles_dict[org_slug] = role_name
+    return organization_roles_dict
+
+
+def get_compact_organization_roles(user_id):
+    org_role_users = list(get_organization_role_users(user_id))
+
+    # build dict organization_slug -> (role_name, effective permission mask)
+    organization_roles = {}
+    for org_role_user in org_role_users:
+        organization_role = org_role_user.organization_role
+        organization_roles[str(organization_role.organization.slug_name)] = (
+            str(organization_role.name),
+            organization_role.permission_mask,
+        )
+    return encode_organization_roles(organization_roles)
+
+
+def create_organization_access_token(user_id, access_token):
+    if settings.ORGANIZATION_ROLES_CLAIM_FORMAT == "compact":
+        access_token[COMPACT_CLAIM] = organization_role_claims_cache.get_or_load(
+            user_id,
+            lambda: get_compact_organization_roles(user_id),
+            timeout=60 * 60 * 24,
+        )
+        return access_token
 
-    cache.set(
-        f"organization_roles_{user_id}",
-        organization_roles_dict,
+    organization_roles_dict = organization_roles_cache.get_or_load(
+        user_id,
+        lambda: get_organization_roles(user_id),
         timeout=60 * 60 * 24,
     )
 
@@ -48,6 +89,11 @@ def create_organization_access_token(user_id, access_token):
     return access_token
 
 
+def get_default_organization_slug(user):
+    default_organization = user.default_organization
+    return default_organization.slug_name if default_organization else None
+
+
 def create_organization_jwt_tokens(user, organization_slug, issuer=None, **kwargs):
     refresh_token, access_token = create_jwt_tokens(user, issuer, **kwargs)
 
@@ -56,13 +102,64 @@ def create_organization_jwt_tokens(user, organization_slug, issuer=None, **kwarg
     return refresh_token, access_token
 
 
-def handle_access_token(access_token, provider: Literal["GOOGLE"]):
-    info_url = settings.OAUTH_CLIENTS[provider]["INFO_URL"]
+def get_jwks_cache(provider):
+    if provider not in _jwks_caches:
+        _jwks_caches[provider] = JWKSCache(
+            settings.OAUTH_CLIENTS[provider]["JWKS_URL"], oauth_session
+        )
+    return _jwks_caches[provider]
+
+
+def is_jwt(token):
+    """Opaque access tokens may contain dots too, only a decodable header counts"""
+    try:
+        jwt.get_unverified_header(token)
+    except jwt.DecodeError:
+        return False
+    return True
+
+
+def verify_id_token(id_token, provider: Literal["GOOGLE"]):
+    """
+    Verify an OpenID Connect ID token locally against the provider's cached JWKS
+    """
+    client = settings.OAUTH_CLIENTS[provider]
+    try:
+        kid = jwt.get_unverified_header(id_token).get("kid")
+        payload = jwt.decode(
+            id_token,
+            get_jwks_cache(provider).get_signing_key(kid),
+            algorithms=["RS256"],
+            audience=client["CLIENT_ID"],
+            issuer=client["ISSUERS"],
+        )
+    except jwt.InvalidTokenError as e:
+        raise ValidationError({"error": f"Invalid ID token: {e}"})
+
+    if not payload.get("email_verified"):
+        raise ValidationError({"error": "The email address is not verified"})
+    return payload
+
+
+def get_user_info(access_token, provider: Literal["GOOGLE"]):
+    client = settings.OAUTH_CLIENTS[provider]
+
+    # ID tokens are JWTs and can be verified without a round trip to the provider
+    if client.get("JWKS_URL") and is_jwt(access_token):
+        try:
+            return verify_id_token(access_token, provider)
+        except (requests.RequestException, JWKSError) as e:
+            # The signing keys could not be loaded, ask the provider instead
+            logger.warning(f"Loading {provider} JWKS failed, using INFO_URL: {e}")
 
     headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.post(url=info_url, headers=headers, timeout=10)
+    response = oauth_session.post(url=client["INFO_URL"], headers=headers, timeout=10)
     response.raise_for_status()
-    user_info_dict = response.json()
+    return response.json()
+
+
+def handle_access_token(access_token, provider: Literal["GOOGLE"]):
+    user_info_dict = get_user_info(access_token, provider)
     given_name = user_info_dict.get("given_name", "")
     family_name = user_info_dict.get("family_name", "")
     email = user_info_dict["email"]
@@ -74,12 +171,7 @@ def handle_access_token(access_token, provider: Literal["GOOGLE"]):
         root_user.last_name = family_name
         root_user.save()
 
-    default_organization = Organization.objects.filter(
-        organizationpolicy__organizationrole__organization_role_user__root_user=root_user,
-    ).first()
-    default_organization_slug = (
-        default_organization.slug_name if default_organization else None
-    )
+    default_organization_slug = get_default_organization_slug(root_user)
 
     refresh, access = create_organization_jwt_tokens(
         root_user, organization_slug=default_organization_slug
@@ -96,10 +188,19 @@ def handle_access_token(access_token, provider: Literal["GOOGLE"]):
 
 def render_email_format(template, data):
     try:
-        html_message = render_to_string(
-            template,
-            data,
-        )
+        # Django always wraps the default engine's loaders in the cached
+        # loader (also with DEBUG on), so each template is compiled once
+        html_message = render_to_string(template, {**EMAIL_TEMPLATE_DEFAULTS, **data})
         return html_message
     except Exception as e:
         raise ValidationError({"error": f"Error: {e}"})
+
+
+def queue_password_reset_emails(emails):
+    """
+    Enqueue password reset emails for delivery by the Celery worker.
+
+    Only the addresses go through the broker; the worker mints the reset tokens,
+    renders the messages and sends all of them over one SMTP session.
+    """
+    task_producer.send(SEND_EMAIL_TASK, {"emails": emails})
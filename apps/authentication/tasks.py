@@ -0,0 +1,94 @@
+import logging
+import threading
+from smtplib import SMTPException, SMTPServerDisconnected
+
+from common.celery.tasks import task
+from common.utils.token_jwt import generate_token
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.utils.html import strip_tags
+
+from apps.authentication.constants import (
+    PASSWORD_RESET_SUBJECT,
+    PASSWORD_RESET_TEMPLATE,
+    SEND_EMAIL_TASK,
+)
+from apps.authentication.services import render_email_format
+from bootstrap_service.celery import TASK_PREFIX
+
+logger = logging.getLogger(__name__)
+
+_connection = None
+_connection_lock = threading.Lock()
+
+MAX_RETRIES = 3
+
+
+def _get_connection():
+    """Return the worker's SMTP connection, opened once and reused across tasks"""
+    global _connection
+    if _connection is None:
+        if (
+            settings.EMAIL_BACKEND == "django.core.mail.backends.smtp.EmailBackend"
+            and not settings.EMAIL_HOST
+        ):
+            raise ImproperlyConfigured("EMAIL_HOST must be set to send emails")
+        _connection = get_connection()
+    _connection.open()
+    return _connection
+
+
+def _build_password_reset_message(email):
+    # The reset token is minted here so it never sits in the broker payload
+    token = generate_token({"email": email})
+    html_message = render_email_format(
+        PASSWORD_RESET_TEMPLATE,
+        {
+            "redirect_url": f"{settings.HOST_FRONTEND_ADMIN}/auth/reset-password?token={token}",
+        },
+    )
+    message = EmailMultiAlternatives(
+        subject=PASSWORD_RESET_SUBJECT,
+        body=strip_tags(html_message),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[email],
+    )
+    message.attach_alternative(html_message, "text/html")
+    return message
+
+
+def _send(connection, message):
+    try:
+        connection.send_messages([message])
+    except SMTPServerDisconnected:
+        # The server dropped the idle connection, reconnect once
+        connection.close()
+        connection.open()
+        connection.send_messages([message])
+
+
+@task(name=f"{TASK_PREFIX}{SEND_EMAIL_TASK}", max_retries=MAX_RETRIES)
+def send_password_reset_emails(**kwargs):
+    failed, error = [], None
+
+    with _connection_lock:
+        connection = _get_connection()
+        for email in kwargs["emails"]:
+            try:
+                _send(connection, _build_password_reset_message(email))
+            except (SMTPException, OSError) as e:
+                logger.warning(f"Sending password reset email to {email} failed: {e}")
+                failed.append(email)
+                error = e
+
+    sent = len(kwargs["emails"]) - len(failed)
+    logger.info(f"Sent {sent} email(s)")
+
+    if failed:
+        # Retry only the messages that were not delivered, so nobody gets a duplicate
+        retries = send_password_reset_emails.request.retries
+        raise send_password_reset_emails.retry(
+            kwargs={"emails": failed}, exc=error, countdown=2 ** (retries + 1)
+        )
+    return sent
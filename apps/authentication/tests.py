@@ -0,0 +1,64 @@
+from django.contrib.auth.hashers import identify_hasher
+from django.test import TestCase, override_settings
+
+from apps.authentication.hashers import PooledPBKDF2PasswordHasher
+from apps.organization_roles.constants import OrganizationRoleType
+from utils.query_budget import query_budget
+from utils.testing import (
+    clear_caches,
+    create_member,
+    create_organization,
+    get_test_caches,
+)
+
+PASSWORD = "Password@123"  # nosec B105
+
+
+@override_settings(QUERY_BUDGET_STRICT=True, CACHES=get_test_caches())
+class AuthenticationQueryBudgetTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.organization, roles = create_organization("spacedf")
+        self.user = create_member(
+            "owner@example.com", PASSWORD, roles[OrganizationRoleType.OWNER_ROLE]
+        )
+
+    def login(self):
+        return self.client.post(
+            "/api/bootstrap/auth/login",
+            {"email": self.user.email, "password": PASSWORD},
+            content_type="application/json",
+        )
+
+    def test_login_query_budget(self):
+        with query_budget("LoginAPIView"):
+            response = self.login()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["default_organization"], "spacedf")
+
+    def test_refresh_token_query_budget(self):
+        refresh_token = self.login().json()["refresh"]
+
+        with query_budget("RefreshTokenView"):
+            response = self.client.post(
+                "/api/bootstrap/auth/refresh-token",
+                {"refresh": refresh_token, "organization": "spacedf"},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(CACHES=get_test_caches())
+class PasswordHasherTests(TestCase):
+    def test_stored_hashes_verify_with_the_pooled_hasher(self):
+        _, roles = create_organization("spacedf")
+        user = create_member(
+            "owner@example.com", PASSWORD, roles[OrganizationRoleType.OWNER_ROLE]
+        )
+
+        self.assertIsInstance(
+            identify_hasher(user.password), PooledPBKDF2PasswordHasher
+        )
+        self.assertTrue(user.check_password(PASSWORD))
@@ -0,0 +1,123 @@
+import jwt
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from jwt import InvalidAlgorithmError, InvalidTokenError
+from rest_framework_simplejwt.backends import ALLOWED_ALGORITHMS, TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import format_lazy
+
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "EdDSA"}
+
+
+def _load_key(pem, loader):
+    if not pem:
+        return None
+    if isinstance(pem, str):
+        pem = pem.encode("utf-8")
+    return loader(pem)
+
+
+class KeyedTokenBackend(TokenBackend):
+    """
+    Token backend with key material parsed once per process and ``kid`` rotation.
+
+    Tokens are signed with the current key and, when ``JWT_KEY_ID`` is set,
+    carry it in the ``kid`` header. Verification picks the key by ``kid`` so
+    tokens issued with a previous key or algorithm (``JWT_PREVIOUS_KEYS``)
+    keep verifying until they expire. Tokens without ``kid`` use the entry
+    with an empty ``kid``, or the current key.
+    """
+
+    def __init__(self, algorithm, key_id="", previous_keys=(), **kwargs):
+        super().__init__(algorithm, **kwargs)
+        self.key_id = key_id or ""
+        self._signing_key = self.signing_key
+        self.verifying_keys = {}
+
+        if algorithm in ASYMMETRIC_ALGORITHMS:
+            self._signing_key = _load_key(
+                self.signing_key, lambda pem: load_pem_private_key(pem, password=None)
+            )
+            verifying_key = _load_key(self.verifying_key, load_pem_public_key)
+            if verifying_key is None and self._signing_key is not None:
+                verifying_key = self._signing_key.public_key()
+        else:
+            verifying_key = self.signing_key
+        self.verifying_keys[self.key_id] = (algorithm, verifying_key)
+
+        for previous_key in previous_keys:
+            previous_algorithm = previous_key["alg"]
+            self._validate_algorithm(previous_algorithm)
+            self.verifying_keys.setdefault(
+                previous_key.get("kid", ""),
+                (
+                    previous_algorithm,
+                    _load_key(previous_key["public_key"], load_pem_public_key),
+                ),
+            )
+
+    def _validate_algorithm(self, algorithm):
+        if algorithm == "EdDSA":
+            return
+        if algorithm not in ALLOWED_ALGORITHMS:
+            raise TokenBackendError(
+                format_lazy(_("Unrecognized algorithm type '{}'"), algorithm)
+            )
+
+    def encode(self, payload):
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+
+        return jwt.encode(
+            jwt_payload,
+            self._signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.key_id} if self.key_id else None,
+            json_encoder=self.json_encoder,
+        )
+
+    def decode(self, token, verify=True):
+        try:
+            key_id = jwt.get_unverified_header(token).get("kid", "")
+            if key_id not in self.verifying_keys:
+                raise TokenBackendError(_("Token is invalid or expired"))
+            algorithm, verifying_key = self.verifying_keys[key_id]
+
+            return jwt.decode(
+                token,
+                verifying_key,
+                algorithms=[algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.get_leeway(),
+                options={
+                    "verify_aud": self.audience is not None,
+                    "verify_signature": verify,
+                },
+            )
+        except InvalidAlgorithmError as ex:
+            raise TokenBackendError(_("Invalid algorithm specified")) from ex
+        except InvalidTokenError as ex:
+            raise TokenBackendError(_("Token is invalid or expired")) from ex
+
+
+def build_token_backend():
+    return KeyedTokenBackend(
+        settings.JWT_ALGORITHM,
+        key_id=settings.JWT_KEY_ID,
+        previous_keys=settings.JWT_PREVIOUS_KEYS,
+        signing_key=api_settings.SIGNING_KEY,
+        verifying_key=api_settings.VERIFYING_KEY,
+        audience=api_settings.AUDIENCE,
+        issuer=api_settings.ISSUER,
+        leeway=api_settings.LEEWAY,
+        json_encoder=api_settings.JSON_ENCODER,
+    )
@@ -1,9 +1,6 @@
 from datetime import datetime, timezone
 
 from common.apps.refresh_tokens.serializers import TokenPairSerializer
-from common.utils.send_email import send_email
-from common.utils.token_jwt import generate_token
-from django.conf import settings
 from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
@@ -24,8 +21,10 @@ from apps.authentication.serializers import (
 )
 from apps.authentication.services import (
     create_organization_access_token,
-    render_email_format,
+    queue_password_reset_emails,
 )
+from utils.metrics import record_cache_lookup
+from utils.views import ReadReplicaMixin
 
 
 class LoginAPIView(TokenObtainPairView):
@@ -67,14 +66,7 @@ class SendEmailToConfirmView(generics.GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        subject = "🔒 Forgot your password? Reset now"
-        token = generate_token({"email": email})
-        data = {
-            "redirect_url": f"{settings.HOST_FRONTEND_ADMIN}/auth/reset-password?token={token}",
-            "host": settings.HOST,
-        }
-        message = render_email_format("email_forget_password.html", data)
-        send_email(settings.DEFAULT_FROM_EMAIL, [email], subject, message)
+        queue_password_reset_emails([email])
         return Response(
             {
                 "result": "Please check your email to continue the password reset process"
@@ -92,7 +84,9 @@ class ForgetPasswordView(generics.GenericAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         token_str = serializer.validated_data["token"]
-        if cache.get(f"used_token: {token_str}"):
+        is_used_token = cache.get(f"used_token: {token_str}")
+        record_cache_lookup("used_token", bool(is_used_token))
+        if is_used_token:
             return Response(
                 {"error": "This token has already been used"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -143,7 +137,7 @@ class ChangePasswordAPIView(generics.GenericAPIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ProfileAPIView(generics.RetrieveUpdateAPIView):
+class ProfileAPIView(ReadReplicaMixin, generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
     queryset = RootUser.objects.all()
 
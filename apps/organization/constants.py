@@ -3,3 +3,5 @@ UNICODE_ASCII_CHARACTER_SET = (
     "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
     "0123456789",
 )
+
+PRUNE_PROCESSED_TASKS_TASK = "bootstrap_prune_processed_tasks"
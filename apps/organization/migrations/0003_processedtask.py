@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-19 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organization", "0002_organization_template"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProcessedTask",
+            fields=[
+                (
+                    "key",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("task_name", models.CharField(max_length=255)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+    ]
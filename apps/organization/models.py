@@ -36,3 +36,11 @@ class Organization(BaseModel):
     template = models.CharField(
         max_length=256, choices=OrganizationTemplate.choices, blank=True, null=True
     )
+
+
+class ProcessedTask(models.Model):
+    """Ledger of task deliveries that have already been applied."""
+
+    key = models.CharField(max_length=255, primary_key=True)
+    task_name = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
@@ -1,13 +1,20 @@
+import logging
+from functools import wraps
 from random import SystemRandom
 
+from celery import current_task
 from django.conf import settings
 from django.db.models import CharField, F, OuterRef, Value
 from django.db.models.functions import Cast, Coalesce, Concat, NullIf, Trim
+from django.utils import timezone
 
 from apps.organization.constants import UNICODE_ASCII_CHARACTER_SET
+from apps.organization.models import ProcessedTask
 from apps.organization_roles.constants import OrganizationRoleType
 from apps.organization_roles.models import OrganizationRoleUser
 
+logger = logging.getLogger(__name__)
+
 
 def get_owner_name_query_set():
     return (
@@ -42,3 +49,45 @@ def generate_client_secret():
     length = settings.CLIENT_SECRET_GENERATOR_LENGTH
     rand = SystemRandom()
     return "".join(rand.choice(UNICODE_ASCII_CHARACTER_SET) for _ in range(length))
+
+
+def idempotent_task(func):
+    """
+    Apply a task body at most once per delivery key.
+
+    The key is the message supplied ``idempotency_key`` or the Celery task id,
+    which is kept across redeliveries. The ledger row is written in the
+    caller's transaction, so it is only persisted together with the task's
+    own writes and a rolled back attempt can still be retried.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = kwargs.pop("idempotency_key", None)
+        task_name = func.__name__
+        if current_task:
+            key = key or current_task.request.id
+            task_name = current_task.name or task_name
+
+        if key:
+            _, created = ProcessedTask.objects.get_or_create(
+                key=str(key), defaults={"task_name": task_name}
+            )
+            if not created:
+                logger.info(f"Skipping already processed task {task_name} ({key})")
+                return None
+
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def prune_processed_tasks(retention=None):
+    """
+    Delete ledger rows older than the retention window
+    """
+    retention = retention or settings.PROCESSED_TASK_RETENTION
+    deleted, _ = ProcessedTask.objects.filter(
+        created_at__lt=timezone.now() - retention
+    ).delete()
+    return deleted
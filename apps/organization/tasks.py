@@ -8,18 +8,22 @@ from django.db.models import BooleanField, Case, F, IntegerField, Value, When
 from django.db.models.functions import Greatest
 from django.db.utils import ProgrammingError
 
+from apps.organization.constants import PRUNE_PROCESSED_TASKS_TASK
 from apps.organization.models import Organization
+from apps.organization.services import idempotent_task, prune_processed_tasks
+from bootstrap_service.celery import TASK_PREFIX
 
 logger = logging.getLogger(__name__)
 
 
 @task(
-    name=f"spacedf.tasks.{constants.CONSOLE_SERVICE_ADD_OR_REMOVE_SPACE}",
+    name=f"{TASK_PREFIX}{constants.CONSOLE_SERVICE_ADD_OR_REMOVE_SPACE}",
     autoretry_for=(ProgrammingError,),
     retry_backoff=2,
     max_retries=3,
 )
 @transaction.atomic
+@idempotent_task
 def add_or_remove_space(**kwargs):
     slug_name, action_type = itemgetter("slug_name", "type")(kwargs)
     value = Case(
@@ -35,3 +39,10 @@ def add_or_remove_space(**kwargs):
     Organization.objects.filter(slug_name=slug_name).update(
         total_spaces=Greatest(F("total_spaces") + value, Value(1)),
     )
+
+
+@task(name=f"{TASK_PREFIX}{PRUNE_PROCESSED_TASKS_TASK}")
+def prune_processed_tasks_task(**kwargs):
+    deleted = prune_processed_tasks()
+    logger.info(f"Pruned {deleted} processed task(s)")
+    return deleted
@@ -0,0 +1,36 @@
+from django.test import TestCase, override_settings
+
+from apps.organization_roles.constants import OrganizationRoleType
+from utils.query_budget import query_budget
+from utils.testing import (
+    clear_caches,
+    create_member,
+    create_organization,
+    get_test_caches,
+)
+
+
+@override_settings(QUERY_BUDGET_STRICT=True, CACHES=get_test_caches())
+class OrganizationQueryBudgetTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.organization, roles = create_organization("spacedf")
+        self.user = create_member(
+            "owner@example.com", "Password@123", roles[OrganizationRoleType.OWNER_ROLE]
+        )
+
+    def test_organization_query_budget(self):
+        with query_budget("OrganizationView"):
+            response = self.client.get(
+                "/api/organizations",
+                headers={"X-User-ID": str(self.user.id), "X-Organization": "spacedf"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["slug_name"], "spacedf")
+
+    def test_check_organization_query_budget(self):
+        with query_budget("CheckOrganizationView"):
+            response = self.client.get("/api/organizations/check/spacedf")
+
+        self.assertEqual(response.status_code, 200)
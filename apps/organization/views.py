@@ -8,10 +8,10 @@ from rest_framework.response import Response
 from apps.organization.models import Organization
 from apps.organization.serializers import OrganizationSerializer
 from apps.organization.services import get_owner_name_query_set
-from utils.views import OrganizationRetrieveAPIView
+from utils.views import OrganizationRetrieveAPIView, ReadReplicaMixin
 
 
-class OrganizationView(OrganizationRetrieveAPIView):
+class OrganizationView(ReadReplicaMixin, OrganizationRetrieveAPIView):
     model = Organization
     queryset = Organization.objects.all()
     serializer_class = OrganizationSerializer
@@ -47,7 +47,7 @@ class OrganizationView(OrganizationRetrieveAPIView):
         )
 
 
-class CheckOrganizationView(views.APIView):
+class CheckOrganizationView(ReadReplicaMixin, views.APIView):
     authentication_classes = []
 
     def get(self, request, slug_name):
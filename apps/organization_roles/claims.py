@@ -0,0 +1,62 @@
+from apps.organization_roles.constants import (
+    CUSTOM_ROLE_CODE,
+    PERMISSION_BITS,
+    ROLE_CODES,
+)
+
+COMPACT_CLAIM = "org_roles"
+COMPACT_CLAIM_VERSION = 1
+
+_ROLE_NAMES = {code: name for name, code in ROLE_CODES.items()}
+
+
+def encode_permissions(permissions):
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS.get(permission, 0)
+    return mask
+
+
+def decode_permissions(mask):
+    return {permission for permission, bit in PERMISSION_BITS.items() if mask & bit}
+
+
+def has_permission(mask, permission):
+    bit = PERMISSION_BITS.get(permission)
+    return bool(bit and mask & bit)
+
+
+def encode_organization_roles(organization_roles):
+    """
+    Build the compact claim from ``{org_slug: (role_name, permission_mask)}``.
+
+    Each organization maps to ``[role_code, permission_mask]``; roles outside
+    ``OrganizationRoleType`` use ``CUSTOM_ROLE_CODE``.
+    """
+    return {
+        "v": COMPACT_CLAIM_VERSION,
+        "o": {
+            org_slug: [
+                ROLE_CODES.get(role_name, CUSTOM_ROLE_CODE),
+                permission_mask,
+            ]
+            for org_slug, (role_name, permission_mask) in organization_roles.items()
+        },
+    }
+
+
+def decode_organization_roles(claim):
+    """
+    Decode a compact claim into ``{org_slug: {"role": name, "permissions": set}}``.
+    """
+    version = claim.get("v")
+    if version != COMPACT_CLAIM_VERSION:
+        raise ValueError(f"Unsupported organization roles claim version: {version}")
+
+    return {
+        org_slug: {
+            "role": _ROLE_NAMES.get(role_code),
+            "permissions": decode_permissions(mask),
+        }
+        for org_slug, (role_code, mask) in claim["o"].items()
+    }
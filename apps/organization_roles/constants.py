@@ -8,6 +8,15 @@ class OrganizationRoleType(models.TextChoices):
     VIEWER_ROLE = "Viewer"
 
 
+# Default roles of a new organization and the policy tag each one is built from
+DEFAULT_ROLE_POLICY_TAGS = [
+    (OrganizationRoleType.OWNER_ROLE, "administrator"),
+    (OrganizationRoleType.ADMIN_ROLE, "full-access"),
+    (OrganizationRoleType.VIEWER_ROLE, "read-only"),
+    (OrganizationRoleType.EDITOR_ROLE, "edit-only"),
+]
+
+
 class OrganizationPermission(models.TextChoices):
     # Organization
     UPDATE_ORGANIZATION = "UPDATE_ORGANIZATION"
@@ -30,3 +39,12 @@ class OrganizationPermission(models.TextChoices):
     CREATE_ORGANIZATION_DEVICE = "CREATE_ORGANIZATION_DEVICE"
     UPDATE_ORGANIZATION_DEVICE = "UPDATE_ORGANIZATION_DEVICE"
     DELETE_ORGANIZATION_DEVICE = "DELETE_ORGANIZATION_DEVICE"
+
+
+# Compact token claim codes. Both mappings are append-only: existing tokens and
+# downstream services rely on the position of every entry.
+ROLE_CODES = {role.value: code for code, role in enumerate(OrganizationRoleType, 1)}
+CUSTOM_ROLE_CODE = 0
+PERMISSION_BITS = {
+    permission.value: 1 << bit for bit, permission in enumerate(OrganizationPermission)
+}
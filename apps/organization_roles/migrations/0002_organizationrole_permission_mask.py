@@ -0,0 +1,58 @@
+# Generated by Django 5.0.6 on 2026-10-19 10:21
+
+from django.db import migrations, models
+
+# Permission bit order when this migration was written, frozen so later
+# changes to apps.organization_roles.constants cannot alter the backfill
+PERMISSIONS = [
+    "UPDATE_ORGANIZATION",
+    "DELETE_ORGANIZATION",
+    "READ_ORGANIZATION_ROLE",
+    "CREATE_ORGANIZATION_ROLE",
+    "UPDATE_ORGANIZATION_ROLE",
+    "DELETE_ORGANIZATION_ROLE",
+    "READ_ORGANIZATION_MEMBER",
+    "INVITE_ORGANIZATION_MEMBER",
+    "UPDATE_ORGANIZATION_MEMBER_ROLE",
+    "REMOVE_ORGANIZATION_MEMBER",
+    "READ_ORGANIZATION_DEVICE",
+    "CREATE_ORGANIZATION_DEVICE",
+    "UPDATE_ORGANIZATION_DEVICE",
+    "DELETE_ORGANIZATION_DEVICE",
+]
+PERMISSION_BITS = {permission: 1 << bit for bit, permission in enumerate(PERMISSIONS)}
+
+
+def encode_permissions(permissions):
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS.get(permission, 0)
+    return mask
+
+
+def populate_permission_mask(apps, schema_editor):
+    OrganizationRole = apps.get_model("organization_roles", "OrganizationRole")
+    for role in OrganizationRole.objects.prefetch_related("policies"):
+        permissions = {
+            permission
+            for policy in role.policies.all()
+            for permission in policy.permissions
+        }
+        OrganizationRole.objects.filter(pk=role.pk).update(
+            permission_mask=encode_permissions(permissions)
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organization_roles", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organizationrole",
+            name="permission_mask",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_permission_mask, migrations.RunPython.noop),
+    ]
@@ -27,6 +27,8 @@ class OrganizationRole(BaseModel, SynchronousTenantModel):
         on_delete=models.CASCADE,
         related_name="organization_role",
     )
+    # Union of the policies' permissions, see apps.organization_roles.claims
+    permission_mask = models.BigIntegerField(default=0)
 
 
 class OrganizationRoleUser(BaseModel):
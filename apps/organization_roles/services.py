@@ -1,11 +1,22 @@
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
+from django.db.models import OuterRef, Subquery
 
+from apps.organization_roles.claims import encode_permissions
+from apps.organization_roles.claims import has_permission as has_permission_bit
 from apps.organization_roles.constants import OrganizationPermission
-from apps.organization_roles.models import OrganizationPolicy, OrganizationRole
+from apps.organization_roles.models import (
+    OrganizationPolicy,
+    OrganizationRole,
+    OrganizationRoleUser,
+)
+from utils.cache import TwoTierCache
 
 User = get_user_model()
 
+organization_roles_cache = TwoTierCache("organization_roles")
+organization_role_claims_cache = TwoTierCache("organization_role_claims")
+organization_permissions_cache = TwoTierCache("organization_permissions")
+
 
 default_policies = [
     {
@@ -108,27 +119,107 @@ default_policies = [
 
 
 def create_default_policies(organization):
-    organization_policies = []
-    for policy in default_policies:
-        organization_policy = OrganizationPolicy(**policy, organization=organization)
-        organization_policy.save()
-        organization_policies.append(organization_policy.pk)
-    return organization_policies
+    organization_policies = OrganizationPolicy.objects.bulk_create(
+        [
+            OrganizationPolicy(**policy, organization=organization)
+            for policy in default_policies
+        ]
+    )
+    return [organization_policy.pk for organization_policy in organization_policies]
 
 
 def create_default_organization_role_by_policy_tag(name, tag, organization):
-    policies = OrganizationPolicy.objects.filter(
+    policy_ids = OrganizationPolicy.objects.filter(
         tags__icontains=tag, organization=organization
-    ).all()
+    ).values_list("pk", flat=True)
     organization_role = OrganizationRole(name=name, organization=organization)
     organization_role.save()
-    organization_role.policies.set([policy.pk for policy in policies])
+    organization_role.policies.set(list(policy_ids))
     organization_role.save()
     return organization_role
 
 
 def clear_user_permission_cache(user_id):
     if user_id:
-        cache_key = f"organization_roles_{user_id}"
-        if cache.get(cache_key):
-            cache.delete(cache_key)
+        organization_roles_cache.delete(user_id)
+        organization_role_claims_cache.delete(user_id)
+        organization_permissions_cache.delete(user_id)
+
+
+def get_default_organization_query_set():
+    return (
+        OrganizationRoleUser.objects.filter(root_user_id=OuterRef("pk"))
+        .order_by("created_at", "id")
+        .values("organization_role__organization_id")[:1]
+    )
+
+
+def update_default_organization(user_id):
+    if user_id:
+        User.objects.filter(pk=user_id).update(
+            default_organization_id=Subquery(get_default_organization_query_set())
+        )
+
+
+def refresh_role_permission_masks(role_ids):
+    """
+    Recompute ``permission_mask`` of the given roles from their policies.
+
+    Returns the new mask per role id. Users of a role whose mask changed get
+    their permission caches cleared.
+    """
+    role_ids = set(role_ids)
+    if not role_ids:
+        return {}
+
+    permissions_by_role = {role_id: set() for role_id in role_ids}
+    role_policies = OrganizationRole.policies.through.objects.filter(
+        organizationrole_id__in=role_ids
+    ).values_list("organizationrole_id", "organizationpolicy__permissions")
+    for role_id, permissions in role_policies:
+        permissions_by_role[role_id].update(permissions or [])
+
+    current_masks = dict(
+        OrganizationRole.objects.filter(pk__in=role_ids).values_list(
+            "id", "permission_mask"
+        )
+    )
+    masks = {}
+    changed_role_ids = []
+    for role_id, permissions in permissions_by_role.items():
+        mask = encode_permissions(permissions)
+        masks[role_id] = mask
+        if role_id in current_masks and current_masks[role_id] != mask:
+            OrganizationRole.objects.filter(pk=role_id).update(permission_mask=mask)
+            changed_role_ids.append(role_id)
+
+    user_ids = (
+        OrganizationRoleUser.objects.filter(organization_role_id__in=changed_role_ids)
+        .values_list("root_user_id", flat=True)
+        .distinct()
+    )
+    for user_id in user_ids:
+        clear_user_permission_cache(user_id)
+    return masks
+
+
+def get_organization_permission_masks(user_id):
+    masks = {}
+    org_role_users = OrganizationRoleUser.objects.filter(
+        root_user_id=user_id, organization_role__organization__is_active=True
+    ).values_list(
+        "organization_role__organization__slug_name",
+        "organization_role__permission_mask",
+    )
+    for org_slug, mask in org_role_users:
+        masks[org_slug] = masks.get(org_slug, 0) | mask
+    return masks
+
+
+def has_permission(user_id, org_slug, permission):
+    masks = organization_permissions_cache.get_or_load(
+        user_id,
+        lambda: get_organization_permission_masks(user_id),
+        timeout=60 * 60 * 24,
+    )
+    return has_permission_bit(masks.get(org_slug, 0), permission)
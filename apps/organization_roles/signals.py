@@ -1,17 +1,67 @@
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
-from apps.organization_roles.models import OrganizationRoleUser
-from apps.organization_roles.services import clear_user_permission_cache
+from apps.organization_roles.models import (
+    OrganizationPolicy,
+    OrganizationRole,
+    OrganizationRoleUser,
+)
+from apps.organization_roles.services import (
+    clear_user_permission_cache,
+    refresh_role_permission_masks,
+    update_default_organization,
+)
 
 
 @receiver(post_save, sender=OrganizationRoleUser)
 def handle_post_save(sender, instance, created, **kwargs):
     user_id = getattr(instance, "root_user_id", None)
     clear_user_permission_cache(user_id)
+    update_default_organization(user_id)
 
 
 @receiver(post_delete, sender=OrganizationRoleUser)
 def handle_post_delete(sender, instance, **kwargs):
     user_id = getattr(instance, "root_user_id", None)
     clear_user_permission_cache(user_id)
+    update_default_organization(user_id)
+
+
+@receiver(m2m_changed, sender=OrganizationRole.policies.through)
+def handle_role_policies_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            masks = refresh_role_permission_masks([instance.pk])
+            # Keep the in-memory role in sync so a later save() doesn't reset it
+            instance.permission_mask = masks[instance.pk]
+        return
+
+    # Reverse side: instance is a policy and pk_set holds role ids
+    if action == "pre_clear":
+        instance._cleared_role_ids = list(
+            instance.organizationrole_set.values_list("id", flat=True)
+        )
+    elif action == "post_clear":
+        refresh_role_permission_masks(getattr(instance, "_cleared_role_ids", []))
+    elif action in ("post_add", "post_remove"):
+        refresh_role_permission_masks(pk_set or [])
+
+
+@receiver(post_save, sender=OrganizationPolicy)
+def handle_policy_post_save(sender, instance, created, **kwargs):
+    if not created:
+        refresh_role_permission_masks(
+            instance.organizationrole_set.values_list("id", flat=True)
+        )
+
+
+@receiver(pre_delete, sender=OrganizationPolicy)
+def handle_policy_pre_delete(sender, instance, **kwargs):
+    instance._deleted_role_ids = list(
+        instance.organizationrole_set.values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=OrganizationPolicy)
+def handle_policy_post_delete(sender, instance, **kwargs):
+    refresh_role_permission_masks(getattr(instance, "_deleted_role_ids", []))
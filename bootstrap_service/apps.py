@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class BootstrapServiceConfig(AppConfig):
+    name = "bootstrap_service"
+
+    def ready(self):
+        # Connect the Celery task signals used for task metrics and the
+        # database signal installing the slow query recorder
+        from utils import metrics, slow_queries  # noqa: F401
+        from utils.tracing import setup_tracing
+
+        # Before other apps start RabbitMQ connections and Celery producers
+        setup_tracing()
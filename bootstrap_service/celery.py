@@ -10,6 +10,9 @@ from common.celery import constants
 from dotenv import load_dotenv
 from kombu import Exchange, Queue
 
+from apps.authentication.constants import SEND_EMAIL_TASK
+from apps.organization.constants import PRUNE_PROCESSED_TASKS_TASK
+
 load_dotenv()
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bootstrap_service.settings")
@@ -21,21 +24,40 @@ TASKS_CONSOLE = [
     constants.CONSOLE_SERVICE_ADD_OR_REMOVE_SPACE,
 ]
 
+TASKS_BOOTSTRAP = [
+    SEND_EMAIL_TASK,
+    PRUNE_PROCESSED_TASKS_TASK,
+]
+
+TASK_PREFIX = "spacedf.tasks."
+
 existing = {queue.name: queue for queue in (app.conf.task_queues or ())}
 routes = dict(app.conf.task_routes or {})
 
-for name in TASKS_CONSOLE:
+for name in TASKS_CONSOLE + TASKS_BOOTSTRAP:
     if name not in existing:
         existing[name] = Queue(
             name,
             exchange=Exchange(name, type="direct"),
-            routing_key=f"spacedf.tasks.{name}",
+            routing_key=f"{TASK_PREFIX}{name}",
             durable=True,
         )
-    routes[f"spacedf.tasks.{name}"] = {
+    routes[f"{TASK_PREFIX}{name}"] = {
         "queue": name,
-        "routing_key": f"spacedf.tasks.{name}",
+        "routing_key": f"{TASK_PREFIX}{name}",
     }
 
 app.conf.task_queues = tuple(existing.values())
 app.conf.task_routes = routes
+
+
+@app.on_after_configure.connect
+def setup_periodic_tasks(sender, **kwargs):
+    # Run by the beat scheduler embedded in the bootstrap worker (celery worker -B)
+    from django.conf import settings
+
+    sender.add_periodic_task(
+        settings.PROCESSED_TASK_PRUNE_INTERVAL,
+        sender.signature(f"{TASK_PREFIX}{PRUNE_PROCESSED_TASKS_TASK}"),
+        name=PRUNE_PROCESSED_TASKS_TASK,
+    )
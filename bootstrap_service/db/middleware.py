@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from bootstrap_service.db.routers import has_written, reset_state
+
+
+class ReplicaPinningMiddleware:
+    """
+    Keep a user's reads on the primary for a short while after they wrote.
+
+    Users are identified by the ``X-User-ID`` header set by the gateway.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REPLICA_DATABASES:
+            return self.get_response(request)
+
+        user_id = request.headers.get("X-User-ID")
+        pin_key = f"replica_pin_{user_id}"
+        reset_state(pinned=bool(user_id and cache.get(pin_key)))
+
+        response = self.get_response(request)
+
+        if user_id and has_written():
+            cache.set(pin_key, True, timeout=settings.REPLICA_PIN_SECONDS)
+        reset_state()
+        return response
@@ -0,0 +1,105 @@
+import os
+import threading
+
+from django.core.signals import setting_changed
+from django.db.backends.postgresql import base
+from django.dispatch import receiver
+from gevent import monkey
+from gevent.socket import wait_read, wait_write
+from psycopg2 import OperationalError, extensions
+
+from bootstrap_service.db.pooled_postgresql.creation import DatabaseCreation
+from bootstrap_service.db.pooled_postgresql.pool import ConnectionPool
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def gevent_wait_callback(conn, timeout=None):
+    """Yield to the gevent hub while psycopg2 waits on the socket"""
+    while True:
+        state = conn.poll()
+        if state == extensions.POLL_OK:
+            break
+        elif state == extensions.POLL_READ:
+            wait_read(conn.fileno(), timeout=timeout)
+        elif state == extensions.POLL_WRITE:
+            wait_write(conn.fileno(), timeout=timeout)
+        else:
+            raise OperationalError(f"Bad result from poll: {state}")
+
+
+if monkey.is_module_patched("socket"):
+    extensions.set_wait_callback(gevent_wait_callback)
+
+
+def get_pools():
+    """Return ``(alias, pool)`` pairs of this process"""
+    pid = os.getpid()
+    with _pools_lock:
+        return [
+            (alias, pool)
+            for (pool_pid, alias, _), pool in _pools.items()
+            if pool_pid == pid
+        ]
+
+
+def close_pools(alias=None):
+    """Close this process's pools of ``alias``, or all of them"""
+    pid = os.getpid()
+    with _pools_lock:
+        keys = [key for key in _pools if key[0] == pid and alias in (None, key[1])]
+        pools = [_pools.pop(key) for key in keys]
+    for pool in pools:
+        pool.close()
+
+
+@receiver(setting_changed)
+def _close_pools_on_databases_change(setting, **kwargs):
+    if setting == "DATABASES":
+        close_pools()
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend that borrows connections from a per-process pool.
+
+    Closing a connection returns it to the pool, so with ``CONN_MAX_AGE = 0``
+    every request releases its connection without tearing it down. Pool sizes
+    come from the ``POOL`` entry of the database settings.
+    """
+
+    creation_class = DatabaseCreation
+
+    def _get_or_create_pool(self, conn_params):
+        # Changed connection parameters (e.g. the test database NAME) get a new pool
+        key = (os.getpid(), self.alias, repr(sorted(conn_params.items())))
+        with _pools_lock:
+            if key not in _pools:
+                pool_settings = self.settings_dict.get("POOL", {})
+                connect = super().get_new_connection
+                _pools[key] = ConnectionPool(
+                    lambda: connect(conn_params),
+                    min_size=pool_settings.get("MIN_SIZE", 0),
+                    max_size=pool_settings.get("MAX_SIZE", 10),
+                    max_lifetime=pool_settings.get("MAX_LIFETIME", 3600),
+                    timeout=pool_settings.get("TIMEOUT", 30),
+                    health_check_interval=pool_settings.get(
+                        "HEALTH_CHECK_INTERVAL", 30
+                    ),
+                )
+            return _pools[key]
+
+    def get_new_connection(self, conn_params):
+        self._pool = self._get_or_create_pool(conn_params)
+        self._pool_pid = os.getpid()
+        return self._pool.getconn()
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                pool = getattr(self, "_pool", None)
+                if pool is None or self._pool_pid != os.getpid():
+                    # Inherited across a fork, the pool belongs to the parent
+                    return self.connection.close()
+                pool.putconn(self.connection)
@@ -0,0 +1,24 @@
+from django.db.backends.postgresql import creation
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    """
+    Test database creation that really closes pooled connections.
+
+    Closing a connection only returns it to the pool, but PostgreSQL refuses to
+    drop or copy a database that still has sessions. Replica aliases mirror the
+    test database, so every pool of the process is closed, not just this alias.
+    """
+
+    def _clone_test_db(self, suffix, verbosity, keepdb=False):
+        from bootstrap_service.db.pooled_postgresql.base import close_pools
+
+        self.connection.close()
+        close_pools()
+        super()._clone_test_db(suffix, verbosity, keepdb)
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        from bootstrap_service.db.pooled_postgresql.base import close_pools
+
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -0,0 +1,175 @@
+import logging
+import queue
+import threading
+import time
+
+from psycopg2 import OperationalError, extensions
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """
+    Bounded pool of psycopg2 connections.
+
+    Waiting for a free connection blocks on a queue, which is cooperative when
+    gevent has patched the standard library. Connections are health checked
+    when they were idle for longer than ``health_check_interval`` and are
+    replaced once older than ``max_lifetime``.
+    """
+
+    def __init__(
+        self,
+        connect,
+        min_size=0,
+        max_size=10,
+        max_lifetime=3600,
+        timeout=30,
+        health_check_interval=30,
+    ):
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._idle = queue.LifoQueue()
+        self._in_use = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.timeouts = 0
+        self.created = 0
+        self.discarded = 0
+
+    def getconn(self):
+        self._fill()
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                conn, created_at, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._create()
+                if conn is not None:
+                    return self._checkout(conn, time.monotonic())
+                conn, created_at, idle_since = self._wait(deadline)
+
+            now = time.monotonic()
+            if now - created_at > self.max_lifetime or not self._is_healthy(
+                conn, now - idle_since
+            ):
+                self._discard(conn)
+                continue
+            return self._checkout(conn, created_at)
+
+    def putconn(self, conn):
+        created_at = self._in_use.pop(id(conn), None)
+        if created_at is None or conn.closed or self._closed:
+            self._discard(conn)
+            return
+
+        try:
+            if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            # Django's connect() calls set_autocommit(), which fails inside a
+            # transaction, so pooled connections always idle in autocommit
+            conn.autocommit = True
+        except Exception:
+            self._discard(conn)
+            return
+
+        if time.monotonic() - created_at > self.max_lifetime:
+            self._discard(conn)
+            return
+        self._idle.put((conn, created_at, time.monotonic()))
+
+    def close(self):
+        """Close idle connections, connections in use are closed when returned"""
+        self._closed = True
+        while True:
+            try:
+                conn, _, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    def stats(self):
+        return {
+            "size": self._size,
+            "idle": self._idle.qsize(),
+            "in_use": len(self._in_use),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+            "wait_time": self.wait_time,
+            "timeouts": self.timeouts,
+            "created": self.created,
+            "discarded": self.discarded,
+        }
+
+    def _fill(self):
+        while self._size < self.min_size:
+            conn = self._create()
+            if conn is None:
+                return
+            self._idle.put((conn, time.monotonic(), time.monotonic()))
+
+    def _create(self):
+        with self._lock:
+            if self._size >= self.max_size:
+                return None
+            self._size += 1
+        try:
+            conn = self.connect()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+        self.created += 1
+        return conn
+
+    def _wait(self, deadline):
+        self.waits += 1
+        started_at = time.monotonic()
+        try:
+            return self._idle.get(timeout=max(deadline - started_at, 0))
+        except queue.Empty:
+            self.timeouts += 1
+            raise OperationalError(
+                f"Connection pool exhausted ({self.max_size} connections in use)"
+            )
+        finally:
+            self.wait_time += time.monotonic() - started_at
+
+    def _checkout(self, conn, created_at):
+        self.checkouts += 1
+        self._in_use[id(conn)] = created_at
+        return conn
+
+    def _is_healthy(self, conn, idle_for):
+        if conn.closed:
+            return False
+        if idle_for < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy pooled connection: {e}")
+            return False
+
+    def _discard(self, conn):
+        self.discarded += 1
+        with self._lock:
+            self._size -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
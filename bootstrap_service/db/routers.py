@@ -0,0 +1,144 @@
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_state = threading.local()
+_replica_lag = {}
+
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+@contextmanager
+def use_replica():
+    """Allow reads inside the block to be served by a read replica"""
+    previous = getattr(_state, "use_replica", False)
+    _state.use_replica = True
+    try:
+        yield
+    finally:
+        _state.use_replica = previous
+
+
+@contextmanager
+def use_primary():
+    """
+    Read from the primary inside the block, even within ``use_replica()``.
+
+    Used for reads that fill long-lived caches, which must not keep data
+    from a lagging replica.
+    """
+    previous = getattr(_state, "use_replica", False)
+    _state.use_replica = False
+    try:
+        yield
+    finally:
+        _state.use_replica = previous
+
+
+def pin_primary():
+    """Send every following read of this request to the primary"""
+    _state.pinned = True
+
+
+def is_pinned():
+    return getattr(_state, "pinned", False)
+
+
+def has_written():
+    return getattr(_state, "written", False)
+
+
+def reset_state(pinned=False):
+    _state.use_replica = False
+    _state.pinned = pinned
+    _state.written = False
+
+
+@contextmanager
+def routing_scope():
+    """
+    Fresh routing state for one unit of work outside a request, such as a
+    message handled by a long-lived consumer thread.
+    """
+    reset_state()
+    try:
+        yield
+    finally:
+        reset_state()
+
+
+@task_prerun.connect
+def _reset_state_before_task(**kwargs):
+    reset_state()
+
+
+@task_postrun.connect
+def _reset_state_after_task(**kwargs):
+    reset_state()
+
+
+def get_replica_lag(alias):
+    """Replication lag of a replica in seconds, cached; ``None`` if unreachable"""
+    now = time.monotonic()
+    checked_at, lag = _replica_lag.get(alias, (0.0, None))
+    if now - checked_at < settings.REPLICA_LAG_CHECK_INTERVAL:
+        return lag
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(REPLICA_LAG_QUERY)
+            lag = float(cursor.fetchone()[0])
+    except Exception as e:
+        logger.warning(f"Replica '{alias}' is unavailable: {e}")
+        lag = None
+    _replica_lag[alias] = (now, lag)
+    return lag
+
+
+def get_healthy_replicas():
+    replicas = []
+    for alias in settings.REPLICA_DATABASES:
+        lag = get_replica_lag(alias)
+        if lag is not None and lag <= settings.REPLICA_MAX_LAG:
+            replicas.append(alias)
+    return replicas
+
+
+class ReplicaRouter:
+    """
+    Route reads inside ``use_replica()`` to a replica within the allowed lag.
+
+    Any write pins the rest of the request to the primary, so a request reads
+    its own writes; ``ReplicaPinningMiddleware`` extends this to the user's
+    following requests.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not getattr(_state, "use_replica", False) or is_pinned():
+            return "default"
+        replicas = get_healthy_replicas()
+        return random.choice(replicas) if replicas else "default"  # nosec B311
+
+    def db_for_write(self, model, **hints):
+        _state.written = True
+        pin_primary()
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
@@ -0,0 +1,12 @@
+import os
+
+from prometheus_client import multiprocess
+
+# Recycle workers after this many requests to bound memory growth, 0 disables
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+
+def child_exit(server, worker):
+    # Drop live-only metrics of a worker that exited
+    multiprocess.mark_process_dead(worker.pid)
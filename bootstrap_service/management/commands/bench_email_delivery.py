@@ -0,0 +1,67 @@
+import time
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.management.base import BaseCommand
+
+from utils.benchmark import LocalSMTPServer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare email throughput with a connection per message versus a reused "
+        "connection sending in batches, against a local SMTP stand-in"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=500, required=False)
+        parser.add_argument("--batch-size", type=int, default=50, required=False)
+
+    def _messages(self, count):
+        messages = []
+        for index in range(count):
+            message = EmailMultiAlternatives(
+                subject="Forgot your password? Reset now",
+                body="Reset your password",
+                from_email="noreply@localhost",
+                to=[f"user{index}@localhost"],
+            )
+            message.attach_alternative("<p>Reset your password</p>", "text/html")
+            messages.append(message)
+        return messages
+
+    def _connection(self, server):
+        return get_connection(
+            "django.core.mail.backends.smtp.EmailBackend",
+            host="127.0.0.1",
+            port=server.port,
+            username="",
+            password="",
+            use_tls=False,
+        )
+
+    def handle(self, *args, **kwargs):
+        count, batch_size = kwargs["messages"], kwargs["batch_size"]
+
+        with LocalSMTPServer() as server:
+            messages = self._messages(count)
+            started_at = time.perf_counter()
+            for message in messages:
+                self._connection(server).send_messages([message])
+            elapsed = time.perf_counter() - started_at
+            self.stdout.write(
+                f"connection per message: {count / elapsed:.1f} messages/s"
+            )
+
+            messages = self._messages(count)
+            started_at = time.perf_counter()
+            connection = self._connection(server)
+            connection.open()
+            for start in range(0, count, batch_size):
+                end = start + batch_size
+                connection.send_messages(messages[start:end])
+            connection.close()
+            elapsed = time.perf_counter() - started_at
+            self.stdout.write(
+                f"reused connection, batch={batch_size}: {count / elapsed:.1f} messages/s"
+            )
+            self.stdout.write(f"stand-in received {server.received} messages")
@@ -0,0 +1,39 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.authentication.services import render_email_format
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the first (compiling) render and steady renders/s of an email template"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--template",
+            type=str,
+            default="email_forget_password.html",
+            required=False,
+        )
+        parser.add_argument("--iterations", type=int, default=2000, required=False)
+
+    def handle(self, *args, **kwargs):
+        template, iterations = kwargs["template"], kwargs["iterations"]
+        data = {
+            "redirect_url": f"{settings.HOST_FRONTEND_ADMIN}/auth/reset-password?token=x",
+        }
+
+        started_at = time.perf_counter()
+        render_email_format(template, data)
+        first = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            render_email_format(template, data)
+        steady = iterations / (time.perf_counter() - started_at)
+
+        self.stdout.write(f"first render: {first * 1000:.2f}ms")
+        self.stdout.write(f"cached template: {steady:.0f} renders/s")
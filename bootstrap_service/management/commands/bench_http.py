@@ -0,0 +1,175 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client, override_settings
+
+from apps.organization_roles.models import OrganizationRoleUser
+from bootstrap_service.management.commands.generate_bench_data import (
+    BENCH_PASSWORD,
+    BENCH_PREFIX,
+)
+from utils.benchmark import LocalSMTPServer, format_summary, summarize
+
+SCENARIOS = ["login", "refresh", "organizations", "organizations_search", "check"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the WSGI app with scripted auth and organization scenarios over the "
+        "dataset from generate_bench_data and report throughput and latency. "
+        "Postgres and Redis must be reachable, outbound email goes to a local "
+        "SMTP stand-in"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, required=False)
+        parser.add_argument("--concurrency", type=int, default=8, required=False)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=SCENARIOS,
+            help="Scenario to run, can be repeated (default: all)",
+        )
+        parser.add_argument("--seed", type=int, default=42, required=False)
+        parser.add_argument(
+            "--output", required=False, help="Write the results as JSON to this path"
+        )
+
+    def _load_members(self):
+        # Users weighted by their number of memberships, like real traffic
+        members = list(
+            OrganizationRoleUser.objects.filter(
+                root_user__email__startswith=f"{BENCH_PREFIX}-"
+            ).values_list(
+                "root_user_id",
+                "root_user__email",
+                "organization_role__organization__slug_name",
+            )
+        )
+        if not members:
+            raise CommandError("No benchmark data found, run generate_bench_data first")
+        return [
+            {"user_id": str(user_id), "email": email, "organization": slug_name}
+            for user_id, email, slug_name in members
+        ]
+
+    def _login(self, client, member):
+        return client.post(
+            "/api/bootstrap/auth/login",
+            {"email": member["email"], "password": BENCH_PASSWORD},
+            content_type="application/json",
+        )
+
+    def _refresh_tokens(self, members):
+        client = Client(raise_request_exception=False)
+        tokens = {}
+        for member in members:
+            if member["email"] in tokens:
+                continue
+            response = self._login(client, member)
+            if response.status_code != 200:
+                raise CommandError(f"Login failed for {member['email']}: {response}")
+            tokens[member["email"]] = response.json()["refresh"]
+        return tokens
+
+    def _request(self, scenario, client, member, refresh_tokens):
+        if scenario == "login":
+            return self._login(client, member)
+        if scenario == "refresh":
+            return client.post(
+                "/api/bootstrap/auth/refresh-token",
+                {
+                    "refresh": refresh_tokens[member["email"]],
+                    "organization": member["organization"],
+                },
+                content_type="application/json",
+            )
+        headers = {
+            "X-User-ID": member["user_id"],
+            "X-Organization": member["organization"],
+        }
+        if scenario == "organizations":
+            return client.get("/api/organizations", headers=headers)
+        if scenario == "organizations_search":
+            return client.get(
+                "/api/organizations", {"search": "Benchmark"}, headers=headers
+            )
+        return client.get(f"/api/organizations/check/{member['organization']}")
+
+    def _run(self, scenario, plan, concurrency, refresh_tokens):
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+        local = threading.local()
+        opened = []
+
+        def worker(member):
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = Client(raise_request_exception=False)
+                # Database connections are per thread, register them so they
+                # can be closed once the pool has shut down
+                with lock:
+                    for alias in connections:
+                        connection = connections[alias]
+                        connection.inc_thread_sharing()
+                        opened.append(connection)
+            started_at = time.perf_counter()
+            response = self._request(scenario, client, member, refresh_tokens)
+            elapsed = time.perf_counter() - started_at
+            with lock:
+                latencies.append(elapsed)
+                if response.status_code >= 400:
+                    errors.append(response.status_code)
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(worker, plan))
+        elapsed = time.perf_counter() - started_at
+
+        for connection in opened:
+            connection.close()
+            connection.dec_thread_sharing()
+        return latencies, errors, elapsed
+
+    def handle(self, *args, **kwargs):
+        scenarios = kwargs["scenario"] or SCENARIOS
+        rng = random.Random(kwargs["seed"])  # nosec B311
+        members = self._load_members()
+        plan = [rng.choice(members) for _ in range(kwargs["requests"])]
+
+        results = {}
+        with LocalSMTPServer() as smtp, override_settings(
+            EMAIL_HOST="127.0.0.1", EMAIL_PORT=smtp.port, EMAIL_USE_TLS=False
+        ):
+            refresh_tokens = {}
+            if "refresh" in scenarios:
+                refresh_tokens = self._refresh_tokens(plan)
+
+            for scenario in scenarios:
+                latencies, errors, elapsed = self._run(
+                    scenario, plan, kwargs["concurrency"], refresh_tokens
+                )
+                self.stdout.write(format_summary(scenario, latencies, elapsed))
+                if errors:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"{scenario}: {len(errors)} error responses "
+                            f"{sorted(set(errors))}"
+                        )
+                    )
+                results[scenario] = {
+                    **summarize(latencies),
+                    "errors": len(errors),
+                    "throughput": len(latencies) / elapsed,
+                    "concurrency": kwargs["concurrency"],
+                }
+
+        if kwargs["output"]:
+            with open(kwargs["output"], "w") as f:
+                json.dump(results, f, indent=2)
@@ -0,0 +1,62 @@
+import time
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from django.core.management.base import BaseCommand
+
+
+def _private_pem(private_key):
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+
+
+class Command(BaseCommand):
+    help = "Measure JWT sign/verify operations per second for each supported algorithm"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=2000, required=False)
+
+    def _ops_per_second(self, func, iterations):
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return iterations / (time.perf_counter() - started_at)
+
+    def handle(self, *args, **kwargs):
+        iterations = kwargs["iterations"]
+        payload = {
+            "token_type": "access",
+            "user_id": "00000000-0000-0000-0000-000000000000",
+            "organization_roles": {"spacedf": "Owner"},
+        }
+        keys = {
+            "RS256": rsa.generate_private_key(public_exponent=65537, key_size=2048),
+            "ES256": ec.generate_private_key(ec.SECP256R1()),
+            "EdDSA": ed25519.Ed25519PrivateKey.generate(),
+        }
+
+        for algorithm, private_key in keys.items():
+            public_key = private_key.public_key()
+            token = jwt.encode(payload, private_key, algorithm=algorithm)
+            pem = _private_pem(private_key)
+
+            sign_pem = self._ops_per_second(
+                lambda: jwt.encode(payload, pem, algorithm=algorithm), iterations
+            )
+            sign = self._ops_per_second(
+                lambda: jwt.encode(payload, private_key, algorithm=algorithm),
+                iterations,
+            )
+            verify = self._ops_per_second(
+                lambda: jwt.decode(token, public_key, algorithms=[algorithm]),
+                iterations,
+            )
+            self.stdout.write(
+                f"{algorithm}: sign(pem per call)={sign_pem:.0f}/s "
+                f"sign(preloaded)={sign:.0f}/s verify(preloaded)={verify:.0f}/s "
+                f"token={len(token)}B"
+            )
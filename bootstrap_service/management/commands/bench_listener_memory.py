@@ -0,0 +1,88 @@
+import gc
+import json
+import resource
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+
+from utils.event_publisher import EventPublisher
+
+
+class StandInChannel:
+    """Counts what the discovery handler does with a pika channel"""
+
+    def __init__(self):
+        self.published = 0
+        self.acked = 0
+        self.nacked = 0
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        self.published += 1
+
+    def basic_ack(self, delivery_tag):
+        self.acked += 1
+
+    def basic_nack(self, delivery_tag, requeue=True):
+        self.nacked += 1
+
+
+class Command(BaseCommand):
+    help = (
+        "Feed discovery messages to the discovery listener handler and report "
+        "memory growth of the process"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=100000, required=False)
+        parser.add_argument("--report-every", type=int, default=10000, required=False)
+        parser.add_argument("--warmup", type=int, default=1000, required=False)
+        parser.add_argument("--top", type=int, default=10, required=False)
+
+    def _feed(self, publisher, channel, start, count):
+        for index in range(start, start + count):
+            body = json.dumps({"reply_to": f"bench.reply.{index % 100}"}).encode()
+            publisher._handle_discovery_request(
+                channel, SimpleNamespace(delivery_tag=index), None, body
+            )
+
+    def _rss_mb(self):
+        # Peak resident set size, kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    def handle(self, *args, **kwargs):
+        publisher = EventPublisher()
+        channel = StandInChannel()
+        messages, report_every = kwargs["messages"], kwargs["report_every"]
+
+        self._feed(publisher, channel, 0, kwargs["warmup"])
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+        baseline_size = tracemalloc.get_traced_memory()[0]
+
+        started_at = time.perf_counter()
+        sent = 0
+        while sent < messages:
+            count = min(report_every, messages - sent)
+            self._feed(publisher, channel, kwargs["warmup"] + sent, count)
+            sent += count
+            gc.collect()
+            current = tracemalloc.get_traced_memory()[0]
+            self.stdout.write(
+                f"{sent} messages: traced growth="
+                f"{(current - baseline_size) / 1024:.1f}KiB "
+                f"peak rss={self._rss_mb():.1f}MiB "
+                f"rate={sent / (time.perf_counter() - started_at):.0f}/s"
+            )
+
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        self.stdout.write(
+            f"published={channel.published} acked={channel.acked} "
+            f"nacked={channel.nacked}"
+        )
+        self.stdout.write("Largest allocation growth:")
+        for stat in snapshot.compare_to(baseline, "lineno")[: kwargs["top"]]:
+            self.stdout.write(f"    {stat}")
@@ -0,0 +1,146 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.organization_roles.models import OrganizationRoleUser
+from bootstrap_service.management.commands.generate_bench_data import (
+    BENCH_PASSWORD,
+    BENCH_PREFIX,
+)
+from utils.benchmark import format_summary, summarize
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure p99 latency of the organization check endpoint of a running "
+        "server while concurrent logins hash passwords. Start the server with "
+        "gunicorn gevent workers, once with PASSWORD_HASHING_POOL_SIZE=0 (inline "
+        "hashing) and once with the pool, over the generate_bench_data dataset"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000", required=False)
+        parser.add_argument("--logins", type=int, default=200, required=False)
+        parser.add_argument("--concurrency", type=int, default=8, required=False)
+        parser.add_argument("--probes", type=int, default=200, required=False)
+        parser.add_argument(
+            "--probe-interval",
+            type=float,
+            default=0.01,
+            help="Pause between two requests to the check endpoint",
+            required=False,
+        )
+        parser.add_argument(
+            "--output", required=False, help="Write the results as JSON to this path"
+        )
+
+    def _load_member(self):
+        member = (
+            OrganizationRoleUser.objects.filter(
+                root_user__email__startswith=f"{BENCH_PREFIX}-"
+            )
+            .values_list(
+                "root_user__email", "organization_role__organization__slug_name"
+            )
+            .first()
+        )
+        if member is None:
+            raise CommandError("No benchmark data found, run generate_bench_data first")
+        return member
+
+    def _probe(self, session, url, slug, interval, latencies, errors, done):
+        while not done():
+            started_at = time.perf_counter()
+            response = session.get(f"{url}/api/organizations/check/{slug}", timeout=30)
+            latencies.append(time.perf_counter() - started_at)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+            time.sleep(interval)
+
+    def _logins(self, url, email, logins, concurrency, errors):
+        local = threading.local()
+
+        def login(_):
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = requests.Session()
+            response = session.post(
+                f"{url}/api/bootstrap/auth/login",
+                json={"email": email, "password": BENCH_PASSWORD},
+                timeout=60,
+            )
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(login, range(logins)))
+        return time.perf_counter() - started_at
+
+    def handle(self, *args, **kwargs):
+        url = kwargs["url"].rstrip("/")
+        email, slug = self._load_member()
+        session = requests.Session()
+        results = {}
+
+        # Check endpoint latency without login load
+        latencies, errors = [], []
+        self._probe(
+            session,
+            url,
+            slug,
+            kwargs["probe_interval"],
+            latencies,
+            errors,
+            lambda: len(latencies) >= kwargs["probes"],
+        )
+        self.stdout.write(format_summary("check, idle", latencies))
+        results["idle"] = {**summarize(latencies), "errors": len(errors)}
+
+        # Same endpoint while logins hash passwords on the server
+        latencies, errors, login_errors = [], [], []
+        finished = threading.Event()
+        probe = threading.Thread(
+            target=self._probe,
+            args=(
+                session,
+                url,
+                slug,
+                kwargs["probe_interval"],
+                latencies,
+                errors,
+                finished.is_set,
+            ),
+        )
+        probe.start()
+        try:
+            elapsed = self._logins(
+                url, email, kwargs["logins"], kwargs["concurrency"], login_errors
+            )
+        finally:
+            finished.set()
+            probe.join()
+        self.stdout.write(format_summary("check, during logins", latencies))
+        self.stdout.write(f"logins: {kwargs['logins'] / elapsed:.1f}/s")
+        results["during_logins"] = {**summarize(latencies), "errors": len(errors)}
+        results["logins"] = {
+            "throughput": kwargs["logins"] / elapsed,
+            "errors": len(login_errors),
+            "concurrency": kwargs["concurrency"],
+        }
+
+        if errors or login_errors:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"error responses: check {sorted(set(errors))}, "
+                    f"login {sorted(set(login_errors))}"
+                )
+            )
+
+        if kwargs["output"]:
+            with open(kwargs["output"], "w") as f:
+                json.dump(results, f, indent=2)
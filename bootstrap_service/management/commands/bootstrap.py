@@ -0,0 +1,115 @@
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+from bootstrap_service.celery import app
+from utils.event_publisher import EventPublisher
+
+
+def wait_for_port(host, port, timeout):
+    """Retry a TCP connect with short exponential backoff until ``timeout``"""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError as e:
+            if time.monotonic() + delay > deadline:
+                raise CommandError(f"{host}:{port} not reachable: {e}")
+        time.sleep(delay)
+        delay = min(delay * 2, 2)
+
+
+def wait_for_celery(timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        # Returns as soon as one worker replied
+        if app.control.ping(timeout=1, limit=1):
+            return
+    raise CommandError("No Celery worker answered the ping")
+
+
+class Command(BaseCommand):
+    help = (
+        "Wait for dependencies in parallel, migrate when needed, wait for a "
+        "Celery worker and initialize the organization"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--org-name", type=str, required=False)
+        parser.add_argument("--org-slug", type=str, required=False)
+        parser.add_argument("--owner-email", type=str, required=False)
+        parser.add_argument("--owner-password", type=str, required=False)
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=settings.BOOTSTRAP_WAIT_TIMEOUT,
+            required=False,
+            help="Seconds to wait for each dependency",
+        )
+        parser.add_argument("--skip-init", action="store_true")
+
+    def _step(self, message, func, *args, **kwargs):
+        started_at = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.stdout.write(f"{message} ({time.perf_counter() - started_at:.2f}s)")
+        return result
+
+    def _wait_for_dependencies(self, timeout):
+        with ThreadPoolExecutor(
+            max_workers=len(settings.BOOTSTRAP_DEPENDENCIES) + 1
+        ) as executor:
+            futures = {
+                f"{host}:{port}": executor.submit(wait_for_port, host, port, timeout)
+                for host, port in settings.BOOTSTRAP_DEPENDENCIES
+            }
+            # Does not need any dependency, overlap it with the waits
+            futures["collectstatic"] = executor.submit(
+                call_command, "collectstatic_if_changed", verbosity=0
+            )
+            for name, future in futures.items():
+                future.result()
+                self.stdout.write(f"{name} is ready")
+
+    def _setup_org_events(self):
+        # Django was set up before RabbitMQ was reachable, so the events
+        # exchange, queues and bindings from the app config may be missing
+        connection, _ = EventPublisher().setup_org_event()
+        if connection is None:
+            raise CommandError("Failed to declare the organization event queues")
+        connection.close()
+
+    def _migrate(self):
+        executor = MigrationExecutor(connection)
+        if not executor.migration_plan(executor.loader.graph.leaf_nodes()):
+            self.stdout.write("No migrations to apply")
+            return
+        call_command("migrate", interactive=False)
+
+    def handle(self, *args, **kwargs):
+        timeout = kwargs["timeout"]
+        self._step("Dependencies ready", self._wait_for_dependencies, timeout)
+        self._step("Organization event queues declared", self._setup_org_events)
+        self._step("Migrations done", self._migrate)
+        self._step("Processed tasks pruned", call_command, "prune_processed_tasks")
+        if kwargs["skip_init"]:
+            return
+
+        self._step("Celery worker ready", wait_for_celery, timeout)
+        self._step(
+            "Organization initialized",
+            call_command,
+            "init_organization",
+            org_name=kwargs["org_name"] or os.getenv("ORG_NAME"),
+            org_slug=kwargs["org_slug"] or os.getenv("ORG_SLUG"),
+            owner_email=kwargs["owner_email"] or os.getenv("OWNER_EMAIL"),
+            owner_password=kwargs["owner_password"] or os.getenv("OWNER_PASSWORD"),
+        )
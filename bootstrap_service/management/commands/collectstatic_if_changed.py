@@ -0,0 +1,47 @@
+import hashlib
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import get_finders
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+MANIFEST_NAME = "staticfiles.json"
+SOURCES_HASH_NAME = ".sources.sha256"
+
+
+def get_sources_hash():
+    """Hash of the path, size and mtime of every file collectstatic would copy"""
+    digest = hashlib.sha256()
+    entries = []
+    for finder in get_finders():
+        for path, storage in finder.list(["CVS", ".*", "*~"]):
+            stat = os.stat(storage.path(path))
+            entries.append(f"{path}:{stat.st_size}:{int(stat.st_mtime)}")
+    for entry in sorted(entries):
+        digest.update(entry.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class Command(BaseCommand):
+    help = (
+        "Run collectstatic (hashing and precompressing assets) only when the "
+        "source files changed since the last run"
+    )
+
+    def handle(self, *args, **kwargs):
+        manifest_path = os.path.join(settings.STATIC_ROOT, MANIFEST_NAME)
+        stamp_path = os.path.join(settings.STATIC_ROOT, SOURCES_HASH_NAME)
+        sources_hash = get_sources_hash()
+
+        if os.path.exists(manifest_path) and os.path.exists(stamp_path):
+            with open(stamp_path) as f:
+                if f.read().strip() == sources_hash:
+                    self.stdout.write("Static files unchanged, skipping collectstatic")
+                    return
+
+        call_command("collectstatic", interactive=False, verbosity=kwargs["verbosity"])
+        with open(stamp_path, "w") as f:
+            f.write(sources_hash)
+        self.stdout.write(self.style.SUCCESS("Static files collected"))
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utils.profiling import PROFILE_HEADER, create_profile_token
+
+
+class Command(BaseCommand):
+    help = "Print a signed header value that forces profiling of a request"
+
+    def handle(self, *args, **kwargs):
+        self.stdout.write(f"{PROFILE_HEADER}: {create_profile_token()}")
+        self.stdout.write(
+            f"Valid for {settings.PROFILING_TOKEN_MAX_AGE} seconds, "
+            f"profiles are written to {settings.PROFILING_DIR}"
+        )
@@ -0,0 +1,144 @@
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Subquery
+
+from apps.authentication.models import RootUser
+from apps.organization.models import Organization
+from apps.organization_roles.constants import (
+    DEFAULT_ROLE_POLICY_TAGS,
+    OrganizationRoleType,
+)
+from apps.organization_roles.models import OrganizationRoleUser
+from apps.organization_roles.services import (
+    create_default_organization_role_by_policy_tag,
+    create_default_policies,
+    get_default_organization_query_set,
+)
+
+BENCH_PREFIX = "bench"
+BENCH_PASSWORD = "Benchmark@123"  # nosec B105
+
+# Most members are viewers, few are owners
+ROLE_WEIGHTS = {
+    OrganizationRoleType.OWNER_ROLE: 1,
+    OrganizationRoleType.ADMIN_ROLE: 2,
+    OrganizationRoleType.EDITOR_ROLE: 5,
+    OrganizationRoleType.VIEWER_ROLE: 12,
+}
+
+
+def bench_email(index):
+    return f"{BENCH_PREFIX}-{index}@example.com"
+
+
+def bench_slug(index):
+    return f"{BENCH_PREFIX}-{index}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic tenant dataset for benchmarks: organizations with "
+        "default policies and roles, users and skewed memberships"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--organizations", type=int, default=50, required=False)
+        parser.add_argument("--users", type=int, default=1000, required=False)
+        parser.add_argument("--memberships", type=int, default=3000, required=False)
+        parser.add_argument("--seed", type=int, default=42, required=False)
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete previously generated benchmark data first",
+        )
+
+    def _clear(self):
+        RootUser.objects.filter(email__startswith=f"{BENCH_PREFIX}-").delete()
+        Organization.objects.filter(slug_name__startswith=f"{BENCH_PREFIX}-").delete()
+
+    def _create_organizations(self, count):
+        roles_by_organization = []
+        for index in range(count):
+            organization = Organization.objects.create(
+                name=f"Benchmark Organization {index}",
+                slug_name=bench_slug(index),
+                logo="",
+            )
+            create_default_policies(organization)
+            roles_by_organization.append(
+                {
+                    role_type: create_default_organization_role_by_policy_tag(
+                        role_type, policy_tag, organization
+                    )
+                    for role_type, policy_tag in DEFAULT_ROLE_POLICY_TAGS
+                }
+            )
+        return roles_by_organization
+
+    def _create_memberships(self, rng, users, roles_by_organization, count):
+        # Zipf-like popularity: the n-th organization gets ~1/n of the members
+        organization_weights = [
+            1 / (rank + 1) for rank in range(len(roles_by_organization))
+        ]
+        role_types, role_weights = zip(*ROLE_WEIGHTS.items())
+
+        pairs = set()
+        while len(pairs) < count:
+            organization_index = rng.choices(
+                range(len(roles_by_organization)), organization_weights
+            )[0]
+            pairs.add((rng.randrange(len(users)), organization_index))
+
+        OrganizationRoleUser.objects.bulk_create(
+            [
+                OrganizationRoleUser(
+                    root_user=users[user_index],
+                    organization_role=roles_by_organization[organization_index][
+                        rng.choices(role_types, role_weights)[0]
+                    ],
+                )
+                for user_index, organization_index in pairs
+            ],
+            batch_size=1000,
+        )
+
+    def handle(self, *args, **kwargs):
+        organizations, users, memberships = (
+            kwargs["organizations"],
+            kwargs["users"],
+            kwargs["memberships"],
+        )
+        if memberships > organizations * users:
+            raise CommandError("--memberships cannot exceed organizations * users")
+
+        rng = random.Random(kwargs["seed"])  # nosec B311
+        with transaction.atomic():
+            if kwargs["clear"]:
+                self._clear()
+
+            roles_by_organization = self._create_organizations(organizations)
+            self.stdout.write(
+                self.style.SUCCESS(f"Created {organizations} organizations")
+            )
+
+            password = make_password(BENCH_PASSWORD)
+            root_users = RootUser.objects.bulk_create(
+                [
+                    RootUser(email=bench_email(index), password=password)
+                    for index in range(users)
+                ],
+                batch_size=1000,
+            )
+            self.stdout.write(self.style.SUCCESS(f"Created {users} users"))
+
+            self._create_memberships(
+                rng, root_users, roles_by_organization, memberships
+            )
+            # bulk_create skips the membership signals, set default organizations at once
+            RootUser.objects.filter(email__startswith=f"{BENCH_PREFIX}-").update(
+                default_organization_id=Subquery(get_default_organization_query_set())
+            )
+            self.stdout.write(self.style.SUCCESS(f"Created {memberships} memberships"))
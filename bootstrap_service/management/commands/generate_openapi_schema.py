@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from bootstrap_service.openapi import generate_schema, write_schema
+
+
+class Command(BaseCommand):
+    help = "Generate the OpenAPI document with precompressed variants at build time"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=settings.OPENAPI_SCHEMA_PATH,
+            required=False,
+            help="Path of the JSON document",
+        )
+
+    def handle(self, *args, **kwargs):
+        content = generate_schema()
+        for path in write_schema(content, kwargs["output"]):
+            self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
@@ -16,7 +16,6 @@ import os
 import uuid
 from datetime import datetime
 
-from common.celery.task_senders import send_task
 from common.rabitmq.rabbitmq_provisioner import RabbitMQProvisioner
 from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
@@ -25,7 +24,10 @@ from django.utils import timezone
 
 from apps.authentication.models import RootUser
 from apps.organization.models import Organization
-from apps.organization_roles.constants import OrganizationRoleType
+from apps.organization_roles.constants import (
+    DEFAULT_ROLE_POLICY_TAGS,
+    OrganizationRoleType,
+)
 from apps.organization_roles.models import OrganizationRoleUser
 from apps.organization_roles.services import (
     create_default_organization_role_by_policy_tag,
@@ -33,6 +35,8 @@ from apps.organization_roles.services import (
 )
 from utils.check_tenant_exists import check_tenant_exists
 from utils.event_publisher import publish_org_event
+from utils.query_budget import query_budget
+from utils.task_producer import task_producer
 
 
 class Command(BaseCommand):
@@ -119,15 +123,8 @@ class Command(BaseCommand):
         create_default_policies(organization)
         self.stdout.write(self.style.SUCCESS("Created default policies"))
 
-        role_mappings = [
-            (OrganizationRoleType.OWNER_ROLE, "administrator"),
-            (OrganizationRoleType.ADMIN_ROLE, "full-access"),
-            (OrganizationRoleType.VIEWER_ROLE, "read-only"),
-            (OrganizationRoleType.EDITOR_ROLE, "edit-only"),
-        ]
-
         owner_role = None
-        for role_type, policy_tag in role_mappings:
+        for role_type, policy_tag in DEFAULT_ROLE_POLICY_TAGS:
             role = create_default_organization_role_by_policy_tag(
                 role_type, policy_tag, organization
             )
@@ -137,11 +134,11 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS("Created default roles"))
         return organization, owner_role
 
-    def _send_celery_task(self, org_id, org_name, org_slug, org_template, user):
-        """Send initialization task to Celery."""
-        send_task(
-            name="new_organization",
-            message={
+    def _new_organization_task(self, org_id, org_name, org_slug, org_template, user):
+        """Build the organization initialization Celery task."""
+        return (
+            "new_organization",
+            {
                 "id": org_id,
                 "name": org_name,
                 "slug_name": org_slug,
@@ -160,11 +157,11 @@ class Command(BaseCommand):
             },
         )
 
-    def _send_delete_celery_task(self, org_slug):
-        """Send organization deletion task to Celery."""
-        send_task(
-            name="delete_organization",
-            message={
+    def _delete_organization_task(self, org_slug):
+        """Build the organization deletion Celery task."""
+        return (
+            "delete_organization",
+            {
                 "slug_name": org_slug,
             },
         )
@@ -187,9 +184,6 @@ class Command(BaseCommand):
             },
         )
 
-        # Send Celery task for deletion
-        self._send_delete_celery_task(org_slug)
-
         # Delete RabbitMQ resources
         provisioner.delete_tenant(vhost_name, org_slug)
         organization.delete()
@@ -197,7 +191,9 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(f"Deleted organization '{org_slug}' (ID: {org_id})")
         )
+        return self._delete_organization_task(org_slug)
 
+    @query_budget("init_organization")
     def handle(self, *args, **kwargs):
         config = self._get_config(**kwargs)
         org_name, org_slug, org_template = (
@@ -210,44 +206,61 @@ class Command(BaseCommand):
         org_id = str(uuid.uuid4())
         provisioner = RabbitMQProvisioner()
 
-        existing_org = Organization.objects.first()
-        if existing_org and existing_org.slug_name != org_slug:
-            self.stdout.write(
-                self.style.WARNING(
-                    f"Organization slug changed from '{existing_org.slug_name}' to '{org_slug}'. "
-                    "Deleting old organization..."
+        # Teardown and provisioning tasks go to the broker in one batch; the
+        # teardown is still sent if provisioning the new organization fails
+        tasks = []
+        try:
+            existing_org = Organization.objects.first()
+            if existing_org and existing_org.slug_name != org_slug:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Organization slug changed from '{existing_org.slug_name}' to '{org_slug}'. "
+                        "Deleting old organization..."
+                    )
                 )
-            )
-            self._delete_organization(provisioner, existing_org)
-            existing_org = None
+                tasks.append(self._delete_organization(provisioner, existing_org))
+                existing_org = None
 
-        if not existing_org:
-            result = self._provision_rabbitmq(provisioner, org_id, org_slug)
-            self.stdout.write(
-                self.style.SUCCESS(f"Creating organization: {org_name} ({org_slug})")
-            )
-            # Create organization, roles, and assign owner
-            user, _ = RootUser.objects.get_or_create(
-                email=owner_email, defaults={"password": encrypted_password}
-            )
-            self.stdout.write(self.style.SUCCESS(f"Created owner user: {owner_email}"))
-            _, owner_role = self._create_organization_with_roles(
-                org_id, org_name, org_slug, result
-            )
-            OrganizationRoleUser(root_user=user, organization_role=owner_role).save()
-            self.stdout.write(
-                self.style.SUCCESS(f"Assigned owner role to {owner_email}")
-            )
+            if not existing_org:
+                result = self._provision_rabbitmq(provisioner, org_id, org_slug)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Creating organization: {org_name} ({org_slug})"
+                    )
+                )
+                # Create organization, roles, and assign owner
+                user, _ = RootUser.objects.get_or_create(
+                    email=owner_email, defaults={"password": encrypted_password}
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(f"Created owner user: {owner_email}")
+                )
+                _, owner_role = self._create_organization_with_roles(
+                    org_id, org_name, org_slug, result
+                )
+                OrganizationRoleUser(
+                    root_user=user, organization_role=owner_role
+                ).save()
+                self.stdout.write(
+                    self.style.SUCCESS(f"Assigned owner role to {owner_email}")
+                )
 
-            # Publish organization event
-            self._publish_org_event(org_id, org_slug, org_name, result)
-            self._send_celery_task(org_id, org_name, org_slug, org_template, user)
-        else:
-            self.stdout.write(
-                self.style.WARNING(
-                    f"Organization '{org_slug}' already exists. Skipping org creation..."
+                # Publish organization event
+                self._publish_org_event(org_id, org_slug, org_name, result)
+                tasks.append(
+                    self._new_organization_task(
+                        org_id, org_name, org_slug, org_template, user
+                    )
                 )
-            )
+            else:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Organization '{org_slug}' already exists. Skipping org creation..."
+                    )
+                )
+        finally:
+            if tasks:
+                task_producer.send_many(tasks)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.organization.services import prune_processed_tasks
+
+
+class Command(BaseCommand):
+    help = "Delete expired entries from the processed task ledger"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Retention in days (defaults to PROCESSED_TASK_RETENTION)",
+            required=False,
+        )
+
+    def handle(self, *args, **kwargs):
+        days = kwargs.get("days")
+        retention = timedelta(days=days) if days is not None else None
+        deleted = prune_processed_tasks(retention)
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} processed task(s)"))
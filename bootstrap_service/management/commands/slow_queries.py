@@ -0,0 +1,46 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.slow_queries import get_reports, reset_reports
+
+
+class Command(BaseCommand):
+    help = "Show slow queries aggregated by fingerprint, with their sampled plans"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=20, required=False)
+        parser.add_argument(
+            "--explain", required=False, help="Print the plan of this fingerprint"
+        )
+        parser.add_argument(
+            "--reset", action="store_true", help="Delete all collected reports"
+        )
+
+    def handle(self, *args, **kwargs):
+        if kwargs["reset"]:
+            reset_reports()
+            self.stdout.write(self.style.SUCCESS("Slow query reports deleted"))
+            return
+
+        reports = get_reports()
+        if kwargs["explain"]:
+            report = next(
+                (r for r in reports if r["fingerprint"] == kwargs["explain"]), None
+            )
+            if report is None:
+                raise CommandError(f"Unknown fingerprint {kwargs['explain']}")
+            if report["plan"] is None:
+                raise CommandError("No plan sampled yet for this fingerprint")
+            self.stdout.write(report["sql"])
+            self.stdout.write(json.dumps(report["plan"], indent=2))
+            return
+
+        for report in reports[: kwargs["limit"]]:
+            self.stdout.write(
+                f"{report['fingerprint']} count={report['count']} "
+                f"total={report['total_time']:.3f}s avg={report['avg_time']:.3f}s "
+                f"max={report['max_time']:.3f}s "
+                f"plan={'yes' if report['plan'] else 'no'} at {report['call_site']}"
+            )
+            self.stdout.write(f"    {report['sql'][:300]}")
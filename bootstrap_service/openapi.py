@@ -0,0 +1,115 @@
+import gzip
+import hashlib
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from drf_yasg import openapi
+from drf_yasg.app_settings import swagger_settings
+from drf_yasg.codecs import OpenAPICodecJson
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+api_info = openapi.Info(
+    title="SPACEDF BOOTSTRAP API",
+    default_version="v1",
+    terms_of_service="https://spacedf.com/terms-of-service",
+    contact=openapi.Contact(email="hello@df.technology"),
+    license=openapi.License(name="Apache 2.0"),
+)
+
+schema_view = get_schema_view(
+    api_info,
+    public=True,
+    permission_classes=[permissions.AllowAny],
+)
+
+# Precompressed variants written next to the schema, preferred in this order
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+_static_schema = None
+
+
+def generate_schema():
+    """Render the OpenAPI document served by ``schema_view`` as JSON bytes"""
+    generator = swagger_settings.DEFAULT_GENERATOR_CLASS(info=api_info)
+    schema = generator.get_schema(request=None, public=True)
+    return OpenAPICodecJson(validators=[], pretty=False).encode(schema)
+
+
+def write_schema(content, path=None):
+    path = path or settings.OPENAPI_SCHEMA_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    variants = {path: content, f"{path}.gz": gzip.compress(content, 9, mtime=0)}
+    if brotli is not None:
+        variants[f"{path}.br"] = brotli.compress(content)
+    for variant_path, variant in variants.items():
+        with open(variant_path, "wb") as f:
+            f.write(variant)
+    return list(variants)
+
+
+def _load_static_schema():
+    """Schema written by generate_openapi_schema, reloaded when the file changes"""
+    global _static_schema
+
+    path = settings.OPENAPI_SCHEMA_PATH
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+    if _static_schema is not None and _static_schema["mtime"] == mtime:
+        return _static_schema
+
+    with open(path, "rb") as f:
+        content = f.read()
+    bodies = {None: content}
+    for encoding, extension in ENCODINGS.items():
+        if os.path.exists(path + extension):
+            with open(path + extension, "rb") as f:
+                bodies[encoding] = f.read()
+
+    _static_schema = {
+        "mtime": mtime,
+        "etag": f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+        "bodies": bodies,
+    }
+    return _static_schema
+
+
+def openapi_schema_view(request):
+    """
+    Serve the pregenerated OpenAPI document with an ETag and the best
+    precompressed variant. Without a generated file the schema is built live.
+    """
+    schema = _load_static_schema()
+    if schema is None:
+        return schema_view.without_ui(cache_timeout=0)(request, format=".json")
+
+    if request.headers.get("If-None-Match") == schema["etag"]:
+        response = HttpResponseNotModified()
+        response["ETag"] = schema["etag"]
+        return response
+
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    encoding = next(
+        (
+            encoding
+            for encoding in ENCODINGS
+            if encoding in schema["bodies"] and encoding in accept_encoding
+        ),
+        None,
+    )
+    response = HttpResponse(schema["bodies"][encoding], content_type="application/json")
+    if encoding:
+        response["Content-Encoding"] = encoding
+    response["ETag"] = schema["etag"]
+    response["Cache-Control"] = f"public, max-age={settings.OPENAPI_SCHEMA_MAX_AGE}"
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
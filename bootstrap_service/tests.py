@@ -0,0 +1,64 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.organization.models import Organization
+from apps.organization_roles.models import OrganizationRoleUser
+from utils.testing import clear_caches, get_test_caches
+
+COMMAND = "bootstrap_service.management.commands.init_organization"
+
+
+@override_settings(QUERY_BUDGET_STRICT=True, CACHES=get_test_caches())
+class InitOrganizationQueryBudgetTests(TestCase):
+    """init_organization is decorated with its query budget, strict mode raises"""
+
+    def setUp(self):
+        clear_caches()
+        # RabbitMQ management API, event publishing and Celery are external
+        self.provisioner = mock.patch(f"{COMMAND}.RabbitMQProvisioner").start()
+        self.provisioner.return_value.provision_tenant.return_value = {
+            "vhost": "spacedf"
+        }
+        mock.patch(f"{COMMAND}.check_tenant_exists", return_value=False).start()
+        mock.patch(f"{COMMAND}.publish_org_event").start()
+        self.task_producer = mock.patch(f"{COMMAND}.task_producer").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def init_organization(self, org_slug="spacedf"):
+        call_command(
+            "init_organization",
+            org_name="SpaceDF",
+            org_slug=org_slug,
+            owner_email="owner@example.com",
+            owner_password="Password@123",
+        )
+
+    def test_init_organization_query_budget(self):
+        self.init_organization()
+
+        self.assertTrue(Organization.objects.filter(slug_name="spacedf").exists())
+        self.assertEqual(OrganizationRoleUser.objects.count(), 1)
+        self.task_producer.send_many.assert_called_once()
+
+    def test_init_organization_again_query_budget(self):
+        self.init_organization()
+        self.init_organization()
+
+        self.assertEqual(Organization.objects.count(), 1)
+
+    def test_slug_change_sends_teardown_and_provisioning_in_one_batch(self):
+        self.init_organization()
+        self.task_producer.reset_mock()
+        self.init_organization(org_slug="spacedf-renamed")
+
+        self.assertEqual(
+            list(Organization.objects.values_list("slug_name", flat=True)),
+            ["spacedf-renamed"],
+        )
+        self.task_producer.send_many.assert_called_once()
+        (tasks,), _ = self.task_producer.send_many.call_args
+        self.assertEqual(
+            [name for name, _ in tasks], ["delete_organization", "new_organization"]
+        )
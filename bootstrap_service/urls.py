@@ -14,42 +14,31 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
-from django.db import connection
-from django.http import HttpResponse
 from django.urls import include, path, re_path
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="SPACEDF BOOTSTRAP API",
-        default_version="v1",
-        terms_of_service="https://spacedf.com/terms-of-service",
-        contact=openapi.Contact(email="hello@df.technology"),
-        license=openapi.License(name="Apache 2.0"),
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
-
-
-def health_check(_):
-    if not connection.ensure_connection():
-        return HttpResponse("OK")
-    return HttpResponse(status=500)
 
+from bootstrap_service.openapi import openapi_schema_view, schema_view
+from utils.health import liveness_view, readiness_view
+from utils.metrics import metrics_view
+from utils.profiling import profile_view, profiles_view
 
 urlpatterns = [
     # docs UI
     re_path(
         r"^bootstrap/docs/$",
-        schema_view.with_ui("swagger", cache_timeout=0),
+        schema_view.with_ui("swagger", cache_timeout=settings.SWAGGER_UI_CACHE_TIMEOUT),
         name="schema-swagger-ui",
     ),
+    path("bootstrap/docs/openapi.json", openapi_schema_view, name="schema-json"),
     # health
-    path("bootstrap/api/health", health_check),
+    path("bootstrap/api/health", liveness_view),
+    path("bootstrap/api/ready", readiness_view),
+    # metrics
+    path("bootstrap/api/metrics", metrics_view),
+    # profiles
+    path("bootstrap/api/profiles", profiles_view),
+    path("bootstrap/api/profiles/<str:name>", profile_view),
     # admin
     path("bootstrap/admin/", admin.site.urls),
     # apis
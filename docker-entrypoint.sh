@@ -7,39 +7,27 @@ echo "ORG_SLUG: spacedf"
 echo "OWNER_EMAIL: ${OWNER_EMAIL:-not set}"
 echo "ORG_TEMPLATE: ${ORG_TEMPLATE:-not set}"
 
-echo "Waiting for RabbitMQ AMQP on rabbitmq:5672..."
-until nc -z rabbitmq 5672; do
-  echo "RabbitMQ not ready, retrying in 2 seconds..."
-  sleep 2
-done
-echo "RabbitMQ is ready"
-
-echo "Waiting for EMQX on emqx:18083..."
-until nc -z emqx 18083; do
-  echo "EMQX not ready, retrying in 2 seconds..."
-  sleep 2
-done
-echo "EMQX is ready"
-
-python manage.py collectstatic --noinput
-
-echo "Running database migrations..."
-python manage.py migrate
+# Shared by gunicorn workers and Celery so /bootstrap/api/metrics aggregates all of them
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
 
+# Starts while dependencies are awaited, bootstrap waits for its ping reply.
+# -B embeds the beat scheduler for periodic tasks (processed task pruning).
 echo "Starting Celery worker..."
-celery -A bootstrap_service worker -l info -c 1 &
-sleep 5
+PROCESS_TYPE=celery celery -A bootstrap_service worker -B \
+  -s /tmp/celerybeat-schedule -l info -c 1 &
 
-echo "Running organization initialization..."
-python manage.py init_organization \
+echo "Bootstrapping (dependencies, migrations, organization initialization)..."
+PROCESS_TYPE=command python manage.py bootstrap \
   --org-name="${ORG_NAME}" \
   --org-slug="spacedf" \
-  --org-template="${ORG_TEMPLATE}" \
   --owner-email="${OWNER_EMAIL}" \
   --owner-password="${OWNER_PASSWORD}"
 
 echo "Starting Gunicorn..."
 exec gunicorn bootstrap_service.wsgi:application \
+  --config python:bootstrap_service.gunicorn_conf \
   --worker-class gevent \
   --bind 0.0.0.0:80 \
   --access-logfile -
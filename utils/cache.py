@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import LockError
+
+from bootstrap_service.db.routers import use_primary
+from utils.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache.invalidate"
+
+_registry = []
+_listener_lock = threading.Lock()
+_listener_started = False
+
+
+class TwoTierCache:
+    """
+    Process local TTL/LRU cache (L1) in front of the shared Redis cache (L2).
+
+    Deletes are broadcast over Redis pub/sub so every worker drops its L1 copy.
+    The short L1 timeout bounds staleness if an invalidation message is missed.
+    """
+
+    def __init__(self, prefix, l1_timeout=None, l1_maxsize=None):
+        self.prefix = prefix
+        self.l1_timeout = l1_timeout or settings.L1_CACHE_TIMEOUT
+        self.l1_maxsize = l1_maxsize or settings.L1_CACHE_MAXSIZE
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        _registry.append(self)
+
+    def make_key(self, key):
+        return f"{self.prefix}_{key}"
+
+    def get(self, key):
+        _start_invalidation_listener()
+        cache_key = self.make_key(key)
+        with self._lock:
+            entry = self._local.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._local.move_to_end(cache_key)
+                    self.l1_hits += 1
+                    record_cache_lookup(self.prefix, True)
+                    return value
+                del self._local[cache_key]
+
+        value = cache.get(cache_key)
+        record_cache_lookup(self.prefix, value is not None)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.l2_hits += 1
+        self._set_local(cache_key, value)
+        return value
+
+    def set(self, key, value, timeout):
+        cache_key = self.make_key(key)
+        cache.set(cache_key, value, timeout=timeout)
+        self._set_local(cache_key, value)
+
+    def get_or_load(self, key, loader, timeout):
+        """
+        Return the cached value, computing it with ``loader`` at most once per key.
+
+        Concurrent misses across workers are serialized by a short Redis lock;
+        waiters re-read the cache once they get the lock instead of calling the
+        loader again. If the lock cannot be taken in time the value is loaded
+        directly so callers never fail because of the lock.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        cache_key = self.make_key(key)
+        lock = cache.lock(
+            f"{cache_key}:lock",
+            timeout=settings.CACHE_LOCK_TIMEOUT,
+            blocking_timeout=settings.CACHE_LOCK_WAIT,
+        )
+        acquired = lock.acquire()
+        try:
+            if acquired:
+                value = cache.get(cache_key)
+                if value is not None:
+                    self._set_local(cache_key, value)
+                    return value
+
+            with use_primary():
+                value = loader()
+            self.set(key, value, timeout)
+            return value
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except LockError:
+                    # The lock expired while loading, another worker may own it now
+                    pass
+
+    def delete(self, key):
+        cache_key = self.make_key(key)
+        cache.delete(cache_key)
+        self.evict(cache_key)
+        try:
+            get_redis_connection("default").publish(INVALIDATION_CHANNEL, cache_key)
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation for {cache_key}: {e}")
+
+    def evict(self, cache_key):
+        with self._lock:
+            self._local.pop(cache_key, None)
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+    def stats(self):
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "l1_size": len(self._local),
+            "hit_rate": (self.l1_hits + self.l2_hits) / lookups if lookups else 0.0,
+            "l1_hit_rate": self.l1_hits / lookups if lookups else 0.0,
+        }
+
+    def _set_local(self, cache_key, value):
+        with self._lock:
+            self._local[cache_key] = (time.monotonic() + self.l1_timeout, value)
+            self._local.move_to_end(cache_key)
+            while len(self._local) > self.l1_maxsize:
+                self._local.popitem(last=False)
+
+
+def _start_invalidation_listener():
+    """Start background subscriber for cross-worker invalidation messages"""
+    global _listener_started
+
+    if _listener_started:
+        return
+
+    with _listener_lock:
+        if _listener_started:
+            return
+        _listener_started = True
+
+    threading.Thread(
+        target=_listen_for_invalidations,
+        name="CacheInvalidationListener",
+        daemon=True,
+    ).start()
+
+
+def _listen_for_invalidations():
+    while True:
+        pubsub = None
+        try:
+            pubsub = get_redis_connection("default").pubsub(
+                ignore_subscribe_messages=True
+            )
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Messages may have been missed while disconnected
+            for two_tier_cache in _registry:
+                two_tier_cache.clear_local()
+
+            for message in pubsub.listen():
+                cache_key = message["data"]
+                if isinstance(cache_key, bytes):
+                    cache_key = cache_key.decode("utf-8")
+                for two_tier_cache in _registry:
+                    two_tier_cache.evict(cache_key)
+
+        except Exception as e:
+            logger.warning("Cache invalidation listener error: %s", e)
+            time.sleep(5)
+        finally:
+            if pubsub is not None:
+                pubsub.close()
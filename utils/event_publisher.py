@@ -23,10 +23,23 @@ from django.conf import settings
 from django.db import close_old_connections
 from django.utils import timezone
 
+from bootstrap_service.db.routers import routing_scope
+from utils.metrics import record_amqp_publish
+
 logger = logging.getLogger(__name__)
 
 _listener_lock = threading.Lock()
 _listener_started = False
+_listener_thread = None
+_listener_consuming = False
+
+
+def get_discovery_listener_state():
+    """Whether the discovery listener thread is running and consuming"""
+    return {
+        "alive": _listener_thread is not None and _listener_thread.is_alive(),
+        "consuming": _listener_consuming,
+    }
 
 
 class EventPublisher:
@@ -105,23 +118,26 @@ class EventPublisher:
 
     def start_discovery_listener(self):
         """Start background listener for discovery requests"""
-        global _listener_started
+        global _listener_started, _listener_thread
 
         with _listener_lock:
             if _listener_started:
                 return
             _listener_started = True
 
-        threading.Thread(
+        _listener_thread = threading.Thread(
             target=self._listen_for_discovery_requests,
             name="OrgDiscoveryListener",
             daemon=True,
-        ).start()
+        )
+        _listener_thread.start()
 
         logger.info("Discovery listener started for spacedf organization")
 
     def _listen_for_discovery_requests(self):
         """Listen and respond to discovery requests with org.created events"""
+        global _listener_consuming
+
         while True:
             connection = None
             try:
@@ -152,24 +168,30 @@ class EventPublisher:
                 )
 
                 logger.info("Listening on queue '%s'", self.console_queue_name)
+                _listener_consuming = True
                 channel.start_consuming()
 
             except Exception as e:
                 logger.exception("Discovery listener error: %s", e)
                 time.sleep(5)
             finally:
+                _listener_consuming = False
                 close_old_connections()
                 if connection and connection.is_open:
                     connection.close()
 
     def _handle_discovery_request(self, channel, method, _properties, body):
         """Handle discovery request and publish org.created for spacedf"""
+        close_old_connections()
+
+        with routing_scope():
+            self._reply_to_discovery_request(channel, method, body)
+
+    def _reply_to_discovery_request(self, channel, method, body):
         from common.rabitmq.rabbitmq_provisioner import RabbitMQProvisioner
 
         from apps.organization.models import Organization
 
-        close_old_connections()
-
         try:
             request = json.loads(body.decode("utf-8"))
             reply_to = request.get("reply_to")
@@ -204,6 +226,7 @@ class EventPublisher:
                 },
             }
 
+            started_at = time.perf_counter()
             channel.basic_publish(
                 exchange="" if reply_to else self.events_exchange,
                 routing_key=reply_to or "org.created",
@@ -212,6 +235,7 @@ class EventPublisher:
                     content_type="application/json", delivery_mode=2
                 ),
             )
+            record_amqp_publish("org.created", "ok", started_at)
 
             channel.basic_ack(delivery_tag=method.delivery_tag)
 
@@ -236,6 +260,7 @@ class EventPublisher:
         Returns:
             True if successful
         """
+        started_at = time.perf_counter()
         try:
             # Connect to RabbitMQ
             connection = pika.BlockingConnection(pika.URLParameters(self.rabbitmq_url))
@@ -270,6 +295,7 @@ class EventPublisher:
             logger.info(f"Published event: {event_type} to {self.events_exchange}")
 
             connection.close()
+            record_amqp_publish(event_type, "ok", started_at)
             return True
 
         except (
@@ -278,9 +304,11 @@ class EventPublisher:
             ConnectionError,
         ) as e:  # noqa: B014
             logger.error(f"Failed to publish event {event_type}: {e}")
+            record_amqp_publish(event_type, "error", started_at)
             return False
         except Exception as e:  # noqa: B036
             logger.error(f"Failed to publish event {event_type}: {e}")
+            record_amqp_publish(event_type, "error", started_at)
             return False
 
 
@@ -0,0 +1,127 @@
+import logging
+import threading
+import time
+
+import pika
+from django.conf import settings
+from django.db import connections
+from django.http import JsonResponse
+from django_redis import get_redis_connection
+
+from utils.event_publisher import get_discovery_listener_state
+
+logger = logging.getLogger(__name__)
+
+_results = {}
+_monitor_lock = threading.Lock()
+_monitor_started = False
+
+
+def probe_postgres():
+    with connections["default"].cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+def probe_redis():
+    get_redis_connection("default").ping()
+
+
+def probe_amqp():
+    parameters = pika.URLParameters(settings.RABBITMQ_URL)
+    parameters.socket_timeout = settings.HEALTH_CHECK_TIMEOUT
+    parameters.blocked_connection_timeout = settings.HEALTH_CHECK_TIMEOUT
+    parameters.connection_attempts = 1
+    pika.BlockingConnection(parameters).close()
+
+
+def probe_discovery_listener():
+    if not get_discovery_listener_state()["consuming"]:
+        raise RuntimeError("Discovery listener is not consuming")
+
+
+PROBES = {
+    "postgres": probe_postgres,
+    "redis": probe_redis,
+    "amqp": probe_amqp,
+    "discovery_listener": probe_discovery_listener,
+}
+
+
+def run_probes():
+    for name, probe in PROBES.items():
+        started_at = time.perf_counter()
+        try:
+            probe()
+            error = None
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        finally:
+            connections.close_all()
+
+        if error and _results.get(name, {}).get("ok", True):
+            logger.warning(f"Health probe {name} failed: {error}")
+        _results[name] = {
+            "ok": error is None,
+            "error": error,
+            "latency": time.perf_counter() - started_at,
+            "checked_at": time.time(),
+        }
+
+
+def _monitor():
+    while True:
+        try:
+            run_probes()
+        except Exception as e:
+            logger.warning(f"Health monitor error: {e}")
+        time.sleep(settings.HEALTH_CHECK_INTERVAL)
+
+
+def start_health_monitor():
+    """Start background probes of the dependencies, cached in this process"""
+    global _monitor_started
+
+    if _monitor_started:
+        return
+
+    with _monitor_lock:
+        if _monitor_started:
+            return
+        _monitor_started = True
+
+    threading.Thread(target=_monitor, name="HealthMonitor", daemon=True).start()
+
+
+def get_health():
+    """Cached probe results; results older than a few intervals count as failed"""
+    start_health_monitor()
+    max_age = settings.HEALTH_CHECK_INTERVAL * 3 + settings.HEALTH_CHECK_TIMEOUT
+    now = time.time()
+    health = {}
+    for name in PROBES:
+        result = _results.get(name)
+        if result is None:
+            health[name] = {"ok": False, "error": "Not checked yet"}
+        elif now - result["checked_at"] > max_age:
+            health[name] = {**result, "ok": False, "error": "Probe result is stale"}
+        else:
+            health[name] = result
+    return health
+
+
+def liveness_view(_):
+    """Process is serving requests and its discovery listener thread is running"""
+    start_health_monitor()
+    if not get_discovery_listener_state()["alive"]:
+        return JsonResponse({"status": "discovery listener stopped"}, status=500)
+    return JsonResponse({"status": "ok"})
+
+
+def readiness_view(_):
+    """Required dependencies passed their latest background probe"""
+    health = get_health()
+    ready = all(health[name]["ok"] for name in settings.HEALTH_READINESS_PROBES)
+    return JsonResponse(
+        {"status": "ok" if ready else "unavailable", "checks": health},
+        status=200 if ready else 503,
+    )
@@ -0,0 +1,120 @@
+import logging
+import re
+import threading
+import time
+
+import jwt
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class JWKSError(Exception):
+    """The JWKS endpoint returned a document that is not a usable key set"""
+
+
+class JWKSCache:
+    """
+    Signing keys of a JWKS endpoint, cached for the ``Cache-Control`` max-age.
+
+    Keys are refreshed in a background thread shortly before they expire, so
+    verification normally never waits on the network. An unknown ``kid``
+    forces a refresh, at most once per ``min_refresh_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        url,
+        session,
+        default_max_age=3600,
+        refresh_margin=300,
+        min_refresh_interval=60,
+        timeout=10,
+    ):
+        self.url = url
+        self.session = session
+        self.default_max_age = default_max_age
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._keys = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def get_signing_key(self, kid):
+        now = time.monotonic()
+        if now >= self._expires_at or (
+            kid not in self._keys
+            and now - self._fetched_at >= self.min_refresh_interval
+        ):
+            self._refresh_or_keep_stale()
+        elif self._expires_at - now <= self.refresh_margin:
+            self._refresh_in_background()
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key id: {kid}")
+        return key
+
+    def refresh(self, stale_before=None):
+        """Fetch the keys, unless another caller fetched them after ``stale_before``"""
+        with self._lock:
+            if stale_before is not None and self._fetched_at > stale_before:
+                return
+            response = self.session.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            try:
+                keys = {
+                    jwk["kid"]: jwt.PyJWK(jwk).key for jwk in response.json()["keys"]
+                }
+            except (KeyError, TypeError, ValueError, jwt.PyJWKError) as e:
+                raise JWKSError(f"Malformed JWKS from {self.url}: {e}") from e
+
+            now = time.monotonic()
+            self._keys = keys
+            self._fetched_at = now
+            self._expires_at = now + self._get_max_age(response.headers)
+
+    def _refresh_or_keep_stale(self):
+        try:
+            # Concurrent misses wait for one fetch instead of each running one
+            self.refresh(stale_before=self._fetched_at)
+        except Exception as e:
+            if not self._keys:
+                raise
+            # Back off instead of retrying on every verification
+            self._expires_at = time.monotonic() + self.min_refresh_interval
+            logger.warning(
+                f"Failed to refresh JWKS from {self.url}, using cached keys: {e}"
+            )
+
+    def _get_max_age(self, headers):
+        match = _MAX_AGE_RE.search(headers.get("Cache-Control", ""))
+        if not match:
+            return self.default_max_age
+        age = int(headers.get("Age", 0) or 0)
+        return max(int(match.group(1)) - age, self.min_refresh_interval)
+
+    def _refresh_in_background(self):
+        # A held lock means a refresh is already running, never wait for it
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        finally:
+            self._lock.release()
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Failed to refresh JWKS from {self.url}: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="JWKSRefresh", daemon=True).start()
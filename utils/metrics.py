@@ -0,0 +1,240 @@
+import os
+import threading
+import time
+
+from celery.signals import task_postrun, task_prerun
+from django.db import connection
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from bootstrap_service.db.pooled_postgresql.base import get_pools
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+REQUEST_LATENCY = Histogram(
+    "bootstrap_request_duration_seconds",
+    "Latency of API requests",
+    ["view", "method", "status"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "bootstrap_request_db_queries",
+    "Database queries executed per API request",
+    ["view"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_TIME = Histogram(
+    "bootstrap_request_db_duration_seconds",
+    "Time spent in database queries per API request",
+    ["view"],
+)
+TASK_LATENCY = Histogram(
+    "bootstrap_task_duration_seconds",
+    "Latency of Celery tasks",
+    ["task", "state"],
+)
+TASK_DB_QUERIES = Histogram(
+    "bootstrap_task_db_queries",
+    "Database queries executed per Celery task",
+    ["task"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "bootstrap_cache_lookups_total",
+    "Cache lookups by key group and result",
+    ["key_group", "result"],
+)
+AMQP_PUBLISH_LATENCY = Histogram(
+    "bootstrap_amqp_publish_duration_seconds",
+    "Latency of publishing events to RabbitMQ",
+    ["event_type", "result"],
+)
+TASK_SEND_LATENCY = Histogram(
+    "bootstrap_task_send_duration_seconds",
+    "Latency of publishing Celery task messages, including broker confirms",
+    ["task", "result"],
+)
+PASSWORD_HASHING_POOL_SIZE = Gauge(
+    "bootstrap_password_hashing_pool_size",
+    "Native threads of the password hashing pool",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASHING_IN_FLIGHT = Gauge(
+    "bootstrap_password_hashing_in_flight",
+    "Password hashes queued or running in the pool",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASHING_WAIT = Histogram(
+    "bootstrap_password_hashing_wait_seconds",
+    "Time password hashes waited for a free pool thread",
+)
+PASSWORD_HASHING_RUN = Histogram(
+    "bootstrap_password_hashing_run_seconds",
+    "Time spent computing password hashes in the pool",
+)
+
+_task_state = threading.local()
+
+
+class QueryRecorder:
+    """Database execute wrapper counting queries and their total time"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started_at
+
+
+def record_cache_lookup(key_group, hit):
+    CACHE_LOOKUPS.labels(key_group, "hit" if hit else "miss").inc()
+
+
+def record_amqp_publish(event_type, result, started_at):
+    AMQP_PUBLISH_LATENCY.labels(event_type, result).observe(
+        time.perf_counter() - started_at
+    )
+
+
+def record_task_send(task_name, result, started_at):
+    TASK_SEND_LATENCY.labels(task_name, result).observe(
+        time.perf_counter() - started_at
+    )
+
+
+def record_password_hashing(wait, run):
+    PASSWORD_HASHING_WAIT.observe(wait)
+    PASSWORD_HASHING_RUN.observe(run)
+
+
+def get_view_name(request):
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        return "unresolved"
+    view = getattr(resolver_match.func, "view_class", resolver_match.func)
+    return getattr(view, "__name__", resolver_match.view_name or "unknown")
+
+
+class MetricsMiddleware:
+    """Record latency and database usage of every request per view"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        started_at = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started_at
+
+        view = get_view_name(request)
+        REQUEST_LATENCY.labels(view, request.method, response.status_code).observe(
+            elapsed
+        )
+        REQUEST_DB_QUERIES.labels(view).observe(recorder.count)
+        REQUEST_DB_TIME.labels(view).observe(recorder.duration)
+        return response
+
+
+@task_prerun.connect
+def _on_task_prerun(task_id=None, task=None, **kwargs):
+    recorder = QueryRecorder()
+    connection.execute_wrappers.append(recorder)
+    _task_state.recorder = recorder
+    _task_state.started_at = time.perf_counter()
+
+
+@task_postrun.connect
+def _on_task_postrun(task_id=None, task=None, state=None, **kwargs):
+    recorder = getattr(_task_state, "recorder", None)
+    if recorder is None:
+        return
+    if recorder in connection.execute_wrappers:
+        connection.execute_wrappers.remove(recorder)
+    _task_state.recorder = None
+
+    TASK_LATENCY.labels(task.name, state or "UNKNOWN").observe(
+        time.perf_counter() - _task_state.started_at
+    )
+    TASK_DB_QUERIES.labels(task.name).observe(recorder.count)
+
+
+class DatabasePoolCollector:
+    """
+    Connection pool state of this process per database alias.
+
+    Pools live in process memory, so with ``PROMETHEUS_MULTIPROC_DIR`` set only
+    the worker answering the scrape is reported, labelled with its pid like the
+    multiprocess gauges of prometheus_client.
+    """
+
+    # (metric name, pool stats key, documentation)
+    GAUGES = [
+        ("size", "size", "Open connections of the pool"),
+        ("idle", "idle", "Idle connections of the pool"),
+        ("in_use", "in_use", "Connections checked out of the pool"),
+    ]
+    COUNTERS = [
+        ("waits", "waits", "Checkouts that waited for a free connection"),
+        ("wait_seconds", "wait_time", "Time spent waiting for a free connection"),
+        ("timeouts", "timeouts", "Checkouts that timed out waiting for a connection"),
+    ]
+
+    def collect(self):
+        totals = {}
+        for alias, pool in get_pools():
+            stats = totals.setdefault(alias, {})
+            for name, value in pool.stats().items():
+                stats[name] = stats.get(name, 0) + value
+
+        pid = str(os.getpid())
+        families = [
+            GaugeMetricFamily(
+                f"bootstrap_db_pool_{name}", documentation, labels=["alias", "pid"]
+            )
+            for name, _, documentation in self.GAUGES
+        ] + [
+            CounterMetricFamily(
+                f"bootstrap_db_pool_{name}", documentation, labels=["alias", "pid"]
+            )
+            for name, _, documentation in self.COUNTERS
+        ]
+        for family, (_, key, _) in zip(families, self.GAUGES + self.COUNTERS):
+            for alias, stats in totals.items():
+                family.add_metric([alias, pid], stats[key])
+            yield family
+
+
+DATABASE_POOL_COLLECTOR = DatabasePoolCollector()
+REGISTRY.register(DATABASE_POOL_COLLECTOR)
+
+
+def get_registry():
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(DATABASE_POOL_COLLECTOR)
+    return registry
+
+
+def metrics_view(_):
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
@@ -0,0 +1,164 @@
+import cProfile
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import FileResponse, Http404, JsonResponse
+
+from utils.metrics import QueryRecorder, get_view_name
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_SALT = "utils.profiling"
+PROFILE_NAME_RE = re.compile(r"^[\w-]+$")
+
+# Self time of profiled functions is grouped by the module they live in
+CATEGORIES = {
+    "db": ("/django/db/", "/psycopg2/"),
+    "redis": ("/redis/", "/django_redis/"),
+    "amqp": ("/pika/", "/utils/event_publisher.py"),
+}
+
+# Only one profiler can be active per thread, and greenlets share the thread
+_profiler_lock = threading.Lock()
+
+
+def create_profile_token():
+    """Value of the ``X-Profile`` header that forces profiling of a request"""
+    return signing.TimestampSigner(salt=PROFILE_SALT).sign(uuid.uuid4().hex)
+
+
+def is_valid_profile_token(token):
+    try:
+        signing.TimestampSigner(salt=PROFILE_SALT).unsign(
+            token, max_age=settings.PROFILING_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def summarize_profile(profiler):
+    stats = pstats.Stats(profiler)
+    categories = dict.fromkeys(CATEGORIES, 0.0)
+    for (filename, _, _), (_, _, self_time, _, _) in stats.stats.items():
+        for category, patterns in CATEGORIES.items():
+            if any(pattern in filename for pattern in patterns):
+                categories[category] += self_time
+                break
+    return {"total": stats.total_tt, "categories": categories}
+
+
+def save_profile(profiler, summary):
+    os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+    name = f"{int(time.time() * 1000)}-{summary['view']}-{uuid.uuid4().hex[:8]}"
+    path = os.path.join(settings.PROFILING_DIR, name)
+    profiler.dump_stats(f"{path}.prof")
+    with open(f"{path}.json", "w") as f:
+        json.dump(summary, f)
+
+    # Keep only the newest profiles
+    names = sorted(
+        file[: -len(".json")]
+        for file in os.listdir(settings.PROFILING_DIR)
+        if file.endswith(".json")
+    )
+    for old_name in names[: -settings.PROFILING_MAX_FILES]:
+        for extension in (".prof", ".json"):
+            try:
+                os.remove(os.path.join(settings.PROFILING_DIR, old_name + extension))
+            except FileNotFoundError:
+                pass
+    return name
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests sampled at ``PROFILING_SAMPLE_RATE`` or carrying a signed
+    ``X-Profile`` header, and write the cProfile stats to ``PROFILING_DIR``.
+
+    Not installed at all unless ``PROFILING_ENABLED`` is set.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+
+    def should_profile(self, request):
+        token = request.headers.get(PROFILE_HEADER)
+        if token:
+            return is_valid_profile_token(token)
+        return random.random() < self.sample_rate  # nosec B311
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+        if not _profiler_lock.acquire(blocking=False):
+            # Another request is being profiled in this process
+            return self.get_response(request)
+
+        try:
+            recorder = QueryRecorder()
+            profiler = cProfile.Profile()
+            started_at = time.perf_counter()
+            with connection.execute_wrapper(recorder):
+                profiler.enable()
+                try:
+                    response = self.get_response(request)
+                finally:
+                    profiler.disable()
+            elapsed = time.perf_counter() - started_at
+        finally:
+            _profiler_lock.release()
+
+        try:
+            summary = {
+                "view": get_view_name(request),
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "elapsed": elapsed,
+                "db_queries": recorder.count,
+                "db_time": recorder.duration,
+                **summarize_profile(profiler),
+            }
+            response["X-Profile-Id"] = save_profile(profiler, summary)
+        except Exception as e:
+            logger.warning(f"Failed to save request profile: {e}")
+        return response
+
+
+@staff_member_required
+def profiles_view(_):
+    if not os.path.isdir(settings.PROFILING_DIR):
+        return JsonResponse({"results": []})
+
+    results = []
+    for file in sorted(os.listdir(settings.PROFILING_DIR), reverse=True):
+        if not file.endswith(".json"):
+            continue
+        with open(os.path.join(settings.PROFILING_DIR, file)) as f:
+            results.append({"id": file[: -len(".json")], **json.load(f)})
+    return JsonResponse({"results": results})
+
+
+@staff_member_required
+def profile_view(_, name):
+    path = os.path.join(settings.PROFILING_DIR, f"{name}.prof")
+    if not PROFILE_NAME_RE.match(name) or not os.path.isfile(path):
+        raise Http404
+    return FileResponse(open(path, "rb"), as_attachment=True, filename=f"{name}.prof")
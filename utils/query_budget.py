@@ -0,0 +1,127 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import ContextDecorator
+
+from django.conf import settings
+from django.db import connection
+
+from utils.metrics import QueryRecorder, get_view_name
+
+logger = logging.getLogger(__name__)
+
+_report_lock = threading.Lock()
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def get_budget(name):
+    return {**settings.QUERY_BUDGET_DEFAULT, **settings.QUERY_BUDGETS.get(name, {})}
+
+
+def check_budget(name, recorder, elapsed, budget=None):
+    """
+    Compare recorded usage with the budget of ``name``.
+
+    Returns the list of violations. With ``QUERY_BUDGET_STRICT`` (tests and CI)
+    a violation raises ``QueryBudgetExceeded`` instead of only being logged.
+    """
+    budget = budget or get_budget(name)
+    if settings.QUERY_BUDGET_REPORT:
+        report_usage(name, recorder)
+    violations = []
+    if budget.get("queries") is not None and recorder.count > budget["queries"]:
+        violations.append(f"{recorder.count} queries > {budget['queries']}")
+    if budget.get("time") is not None and recorder.duration > budget["time"]:
+        violations.append(f"{recorder.duration:.3f}s in queries > {budget['time']}s")
+
+    if violations:
+        message = f"Query budget exceeded for {name}: {', '.join(violations)}"
+        if settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(f"{message} (total {elapsed:.3f}s)")
+    return violations
+
+
+def report_usage(name, recorder):
+    """Keep the highest query count and time seen per budget in the report file"""
+    path = settings.QUERY_BUDGET_REPORT
+    with _report_lock:
+        report = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                report = json.load(f)
+        usage = report.setdefault(name, {"queries": 0, "time": 0.0})
+        usage["queries"] = max(usage["queries"], recorder.count)
+        usage["time"] = max(usage["time"], round(recorder.duration, 4))
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+class query_budget(ContextDecorator):
+    """
+    Assert the database budget of a block, function or management command.
+
+    ``max_queries``/``max_time`` override the ``QUERY_BUDGETS`` entry of ``name``::
+
+        with query_budget("OrganizationView", max_queries=4):
+            client.get("/api/organizations", HTTP_X_USER_ID=user_id)
+    """
+
+    def __init__(self, name, max_queries=None, max_time=None):
+        self.name = name
+        self.max_queries = max_queries
+        self.max_time = max_time
+
+    def _recreate_cm(self):
+        # Each call of a decorated function records into its own instance
+        return self.__class__(self.name, self.max_queries, self.max_time)
+
+    def __enter__(self):
+        # Looked up on entry so override_settings(QUERY_BUDGETS=...) applies
+        self.budget = get_budget(self.name)
+        if self.max_queries is not None:
+            self.budget["queries"] = self.max_queries
+        if self.max_time is not None:
+            self.budget["time"] = self.max_time
+
+        self.recorder = QueryRecorder()
+        self._wrapper = connection.execute_wrapper(self.recorder)
+        self._wrapper.__enter__()
+        self._started_at = time.perf_counter()
+        return self.recorder
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wrapper.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None:
+            check_budget(
+                self.name,
+                self.recorder,
+                time.perf_counter() - self._started_at,
+                self.budget,
+            )
+        return False
+
+
+class QueryBudgetMiddleware:
+    """Flag requests whose view exceeds its query budget"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        started_at = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        violations = check_budget(
+            get_view_name(request), recorder, time.perf_counter() - started_at
+        )
+        if violations:
+            response["X-Query-Budget-Exceeded"] = "; ".join(violations)
+        return response
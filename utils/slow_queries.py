@@ -0,0 +1,221 @@
+import hashlib
+import json
+import logging
+import queue
+import re
+import threading
+import time
+import traceback
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "slow_query"
+FINGERPRINTS_KEY = f"{KEY_PREFIX}:fingerprints"
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%s|\$\d+")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_queue = queue.Queue(maxsize=settings.SLOW_QUERY_QUEUE_SIZE)
+_state = threading.local()
+_worker_lock = threading.Lock()
+_worker_started = False
+
+
+def normalize_sql(sql):
+    """Replace literals and parameters with ``?`` so similar queries match"""
+    sql = _STRING_RE.sub("?", sql)
+    sql = _PLACEHOLDER_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+def fingerprint(sql):
+    return hashlib.sha1(
+        normalize_sql(sql).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()[:16]
+
+
+def get_call_site():
+    """Innermost frame of the project's own code that issued the query"""
+    base_dir = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()[:-2]):
+        if (
+            frame.filename.startswith(base_dir)
+            and "site-packages" not in frame.filename
+            and frame.filename != __file__
+        ):
+            return f"{frame.filename[len(base_dir) + 1:]}:{frame.lineno} {frame.name}"
+    return "unknown"
+
+
+class SlowQueryRecorder:
+    """
+    Database execute wrapper queueing queries slower than ``SLOW_QUERY_THRESHOLD``.
+
+    Aggregation and EXPLAIN run in a background thread, the request only pays
+    for a timer and, for slow queries, a stack walk.
+    """
+
+    def __call__(self, execute, sql, params, many, context):
+        if getattr(_state, "explaining", False):
+            return execute(sql, params, many, context)
+
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started_at
+            if duration >= settings.SLOW_QUERY_THRESHOLD:
+                self.record(sql, params, many, duration, context["connection"].alias)
+
+    def record(self, sql, params, many, duration, alias):
+        try:
+            _queue.put_nowait(
+                {
+                    "sql": sql,
+                    # Parameters stay in memory, only used to EXPLAIN the query
+                    "params": None if many else params,
+                    "duration": duration,
+                    "alias": alias,
+                    "call_site": get_call_site(),
+                }
+            )
+        except queue.Full:
+            return
+        _start_worker()
+
+
+slow_query_recorder = SlowQueryRecorder()
+
+
+@receiver(connection_created)
+def _install_recorder(sender, connection, **kwargs):
+    if not settings.SLOW_QUERY_CAPTURE:
+        return
+    if slow_query_recorder not in connection.execute_wrappers:
+        # First in the list, execute_wrapper() blocks pop the last one on exit
+        connection.execute_wrappers.insert(0, slow_query_recorder)
+
+
+def _start_worker():
+    global _worker_started
+
+    if _worker_started:
+        return
+
+    with _worker_lock:
+        if _worker_started:
+            return
+        _worker_started = True
+
+    threading.Thread(target=_process_queue, name="SlowQueryWorker", daemon=True).start()
+
+
+def _process_queue():
+    while True:
+        entry = _queue.get()
+        try:
+            _process_entry(entry)
+        except Exception as e:
+            logger.warning(f"Failed to record slow query: {e}")
+        finally:
+            connections.close_all()
+
+
+def _process_entry(entry):
+    key = f"{KEY_PREFIX}:{fingerprint(entry['sql'])}"
+    redis = get_redis_connection("default")
+
+    pipeline = redis.pipeline()
+    pipeline.sadd(FINGERPRINTS_KEY, key)
+    pipeline.hincrby(key, "count", 1)
+    pipeline.hincrbyfloat(key, "total_time", entry["duration"])
+    pipeline.hsetnx(key, "sql", normalize_sql(entry["sql"]))
+    pipeline.hset(key, "call_site", entry["call_site"])
+    pipeline.hset(key, "last_seen", time.time())
+    pipeline.hget(key, "max_time")
+    pipeline.hget(key, "plan_at")
+    max_time, plan_at = pipeline.execute()[-2:]
+
+    if max_time is None or entry["duration"] > float(max_time):
+        redis.hset(key, "max_time", entry["duration"])
+
+    if time.time() - float(plan_at or 0) < settings.SLOW_QUERY_EXPLAIN_INTERVAL:
+        return
+    plan = explain(entry["sql"], entry["params"], entry["alias"])
+    if plan is not None:
+        redis.hset(key, mapping={"plan": json.dumps(plan), "plan_at": time.time()})
+
+
+def explain(sql, params, alias):
+    """
+    ``EXPLAIN (ANALYZE, BUFFERS)`` of a captured SELECT.
+
+    ANALYZE executes the statement, so it runs in a rolled back transaction
+    with a statement timeout. Other statements are explained without ANALYZE.
+    """
+    is_select = sql.lstrip().upper().startswith(("SELECT", "WITH"))
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if is_select else "FORMAT JSON"
+
+    _state.explaining = True
+    try:
+        with transaction.atomic(using=alias):
+            with connections[alias].cursor() as cursor:
+                cursor.execute(
+                    "SET LOCAL statement_timeout = %s",
+                    [settings.SLOW_QUERY_EXPLAIN_TIMEOUT],
+                )
+                cursor.execute(f"EXPLAIN ({options}) {sql}", params)
+                plan = cursor.fetchone()[0]
+            transaction.set_rollback(True, using=alias)
+        return plan
+    except Exception as e:
+        logger.warning(f"Failed to EXPLAIN slow query: {e}")
+        return None
+    finally:
+        _state.explaining = False
+
+
+def get_reports():
+    redis = get_redis_connection("default")
+    reports = []
+    for key in redis.smembers(FINGERPRINTS_KEY):
+        key = key.decode("utf-8")
+        data = {
+            field.decode("utf-8"): value.decode("utf-8")
+            for field, value in redis.hgetall(key).items()
+        }
+        if not data:
+            redis.srem(FINGERPRINTS_KEY, key)
+            continue
+        count = int(data.get("count", 0))
+        total_time = float(data.get("total_time", 0))
+        reports.append(
+            {
+                "fingerprint": key.split(":", 1)[1],
+                "sql": data.get("sql", ""),
+                "call_site": data.get("call_site", ""),
+                "count": count,
+                "total_time": total_time,
+                "avg_time": total_time / count if count else 0.0,
+                "max_time": float(data.get("max_time", 0)),
+                "plan": json.loads(data["plan"]) if "plan" in data else None,
+            }
+        )
+    return sorted(reports, key=lambda report: report["total_time"], reverse=True)
+
+
+def reset_reports():
+    redis = get_redis_connection("default")
+    keys = redis.smembers(FINGERPRINTS_KEY)
+    redis.delete(FINGERPRINTS_KEY, *keys)
@@ -0,0 +1,71 @@
+import os
+import threading
+import time
+
+from kombu.pools import ProducerPool
+
+from bootstrap_service.celery import TASK_PREFIX, app
+from utils.metrics import record_task_send
+
+
+class TaskProducer:
+    """
+    Sends Celery task messages over a pooled broker connection of its own.
+
+    Messages go to the direct exchange named after the task with the
+    ``spacedf.tasks.<name>`` routing key, the layout of the task queues in
+    ``bootstrap_service.celery``. A batch reuses one producer and channel for
+    all its messages. The producer's connection enables ``confirm_publish``, so
+    every publish returns once the broker confirmed it and a returned batch is
+    durably queued; other publishers of the app are not slowed by confirms.
+    """
+
+    def __init__(self, celery_app=None):
+        self.app = celery_app or app
+        self._pool = None
+        self._pool_pid = None
+        self._lock = threading.Lock()
+
+    def get_producer_pool(self):
+        """Return this process's producer pool, created on first use after a fork"""
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                connection = self.app.connection_for_write(
+                    transport_options={"confirm_publish": True}
+                )
+                limit = self.app.conf.broker_pool_limit
+                self._pool = ProducerPool(
+                    connection.Pool(limit=limit),
+                    limit=limit,
+                    Producer=self.app.amqp.Producer,
+                )
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    def send(self, name, message):
+        return self.send_many([(name, message)])[0]
+
+    def send_many(self, tasks):
+        """Send ``(name, kwargs)`` pairs in order, return their AsyncResults"""
+        results = []
+        with self.get_producer_pool().acquire(block=True) as producer:
+            for name, message in tasks:
+                started_at = time.perf_counter()
+                try:
+                    results.append(
+                        self.app.send_task(
+                            f"{TASK_PREFIX}{name}",
+                            kwargs=message,
+                            exchange=name,
+                            routing_key=f"{TASK_PREFIX}{name}",
+                            producer=producer,
+                        )
+                    )
+                except Exception:
+                    record_task_send(name, "error", started_at)
+                    raise
+                record_task_send(name, "ok", started_at)
+        return results
+
+
+task_producer = TaskProducer()
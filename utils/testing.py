@@ -0,0 +1,65 @@
+import copy
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+
+from apps.authentication.models import RootUser
+from apps.organization.models import Organization
+from apps.organization_roles.constants import DEFAULT_ROLE_POLICY_TAGS
+from apps.organization_roles.models import OrganizationRoleUser
+from apps.organization_roles.services import (
+    create_default_organization_role_by_policy_tag,
+    create_default_policies,
+)
+from utils.cache import _registry
+
+TEST_CACHE_KEY_PREFIX = "test"
+
+
+def get_test_caches():
+    """``CACHES`` with the default cache moved to the test Redis database"""
+    caches = copy.deepcopy(settings.CACHES)
+    location = urlsplit(caches["default"]["LOCATION"])
+    caches["default"]["LOCATION"] = location._replace(
+        path=f"/{settings.REDIS_TEST_DB}"
+    ).geturl()
+    caches["default"]["KEY_PREFIX"] = TEST_CACHE_KEY_PREFIX
+    return caches
+
+
+def create_organization(slug_name):
+    """Organization with the default policies and roles, like init_organization"""
+    organization = Organization.objects.create(
+        name=slug_name.title(), slug_name=slug_name, logo=""
+    )
+    create_default_policies(organization)
+    roles = {
+        role_type: create_default_organization_role_by_policy_tag(
+            role_type, policy_tag, organization
+        )
+        for role_type, policy_tag in DEFAULT_ROLE_POLICY_TAGS
+    }
+    return organization, roles
+
+
+def create_member(email, password, organization_role):
+    user = RootUser.objects.create(email=email, password=make_password(password))
+    OrganizationRoleUser.objects.create(
+        root_user=user, organization_role=organization_role
+    )
+    user.refresh_from_db()
+    return user
+
+
+def clear_caches():
+    """Empty the test Redis database and the in-process layer of every TwoTierCache"""
+    if settings.CACHES["default"].get("KEY_PREFIX") != TEST_CACHE_KEY_PREFIX:
+        raise AssertionError(
+            "clear_caches() only flushes the test cache, override CACHES with "
+            "get_test_caches() first"
+        )
+    cache.clear()
+    for two_tier_cache in _registry:
+        two_tier_cache.clear_local()
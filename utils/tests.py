@@ -0,0 +1,31 @@
+from django.test import TestCase, override_settings
+
+from apps.authentication.models import RootUser
+from utils.query_budget import QueryBudgetExceeded, query_budget
+
+
+@query_budget("query_budget_test")
+def run_query():
+    return RootUser.objects.exists()
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class QueryBudgetTests(TestCase):
+    def test_budget_is_read_when_entered(self):
+        with override_settings(QUERY_BUDGETS={"query_budget_test": {"queries": 0}}):
+            with self.assertRaises(QueryBudgetExceeded):
+                run_query()
+
+        run_query()
+
+    def test_nested_calls_record_separately(self):
+        @query_budget("query_budget_test", max_queries=1)
+        def run(nested):
+            if nested:
+                run(False)
+            RootUser.objects.exists()
+
+        run(False)
+        # The outer call ran two queries, the inner one only its own
+        with self.assertRaisesMessage(QueryBudgetExceeded, "2 queries > 1"):
+            run(True)
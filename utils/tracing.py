@@ -0,0 +1,106 @@
+import os
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+from opentelemetry import trace
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
+from opentelemetry.trace import SpanKind
+
+tracer = trace.get_tracer(__name__)
+
+_enabled = False
+
+
+def get_span_exporter(name):
+    """
+    Span exporter for ``TRACING_EXPORTER``: ``console``, ``file`` (JSON lines
+    in ``TRACING_FILE``), ``otlp`` (configured by the standard ``OTEL_EXPORTER_OTLP_*``
+    variables) or the dotted path of an exporter class.
+    """
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "file":
+        return ConsoleSpanExporter(
+            out=open(settings.TRACING_FILE, "a"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    if name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter()
+    return import_string(name)()
+
+
+def setup_tracing():
+    """
+    Install the tracer provider and instrument Django, the database, Redis,
+    pika, Celery and requests (RabbitMQ management API, OAuth providers).
+
+    Trace context travels in the AMQP headers of published events and in the
+    headers of Celery messages, so consumers continue the same trace.
+    """
+    global _enabled
+
+    if _enabled or settings.TRACING_EXPORTER == "none":
+        return
+
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.django import DjangoInstrumentor
+    from opentelemetry.instrumentation.pika import PikaInstrumentor
+    from opentelemetry.instrumentation.redis import RedisInstrumentor
+    from opentelemetry.instrumentation.requests import RequestsInstrumentor
+
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: settings.TRACING_SERVICE_NAME}),
+        sampler=ParentBasedTraceIdRatio(settings.TRACING_SAMPLE_RATE),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(get_span_exporter(settings.TRACING_EXPORTER))
+    )
+    trace.set_tracer_provider(provider)
+
+    DjangoInstrumentor().instrument()
+    RedisInstrumentor().instrument()
+    PikaInstrumentor().instrument()
+    CeleryInstrumentor().instrument()
+    RequestsInstrumentor().instrument()
+    _enabled = True
+
+
+class TracingExecuteWrapper:
+    """Database execute wrapper recording a client span per query"""
+
+    def __call__(self, execute, sql, params, many, context):
+        alias = context["connection"].alias
+        operation = sql.lstrip().split(" ", 1)[0].upper()
+        with tracer.start_as_current_span(
+            f"{operation} {alias}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "postgresql",
+                "db.name": context["connection"].settings_dict["NAME"],
+                "db.operation": operation,
+                "db.statement": sql,
+                "db.alias": alias,
+            },
+        ):
+            return execute(sql, params, many, context)
+
+
+tracing_execute_wrapper = TracingExecuteWrapper()
+
+
+@receiver(connection_created)
+def _install_tracing_wrapper(sender, connection, **kwargs):
+    if not _enabled:
+        return
+    if tracing_execute_wrapper not in connection.execute_wrappers:
+        # First in the list, execute_wrapper() blocks pop the last one on exit
+        connection.execute_wrappers.insert(0, tracing_execute_wrapper)
@@ -1,8 +1,22 @@
 from rest_framework import mixins
 from rest_framework.exceptions import ParseError
 from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import SAFE_METHODS
 
 from apps.organization.models import Organization
+from bootstrap_service.db.routers import use_replica
+
+
+class ReadReplicaMixin:
+    """
+    Serve read-only requests of the view from a read replica.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            with use_replica():
+                return super().dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
 
 
 class OrganizationAPIView(GenericAPIView):